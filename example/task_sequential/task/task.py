@@ -1,25 +1,43 @@
 """Defines agent actuator for use in `task_sequential` example."""
 
 from icua.agent import attempt, Actuator
-from star_ray_xml import Update, Expr
+from icua.event import XPathAction
+from star_ray_xml import XMLState, XPathElementsNotFound
+
+
+class MoveAction(XPathAction):
+    """Action that moves the `circle` elements at `xpath` in the given direction."""
+
+    direction: tuple[float, float]
+
+    def __execute__(self, state: XMLState):  # noqa
+        elements = state.xpath(self.xpath)
+        if len(elements) == 0:
+            raise XPathElementsNotFound(
+                "Invalid xpath: `{xpath}` for `update`, no elements were found at this path.",
+                xpath=self.xpath,
+            )
+        # the new position is computed directly rather than with an `Expr` (which is parsed each time)
+        dx, dy = self.direction
+        for element in elements:
+            element.set("cx", element.get("cx") + dx)
+            element.set("cy", element.get("cy") + dy)
 
 
 class MoveActuator(Actuator):
     """Move actuator, will move the `circle` elements in a given direction."""
 
+    # the circles to move, this is the same every move
+    XPATH = "//svg:svg/svg:circle"
+
     @attempt
-    def move(self, direction: tuple[float, float]) -> Update:
+    def move(self, direction: tuple[float, float]) -> MoveAction:
         """Move a `circle` element in the given direction.
 
         Args:
             direction (tuple[float, float]): direction to move.`
 
         Returns:
-            Update: Updates the position of the element.
+            MoveAction: Updates the position of the element.
         """
-        x = Expr("{cx} + {direction}", direction=direction[0])
-        y = Expr("{cy} + {direction}", direction=direction[1])
-        return Update.new(
-            "//svg:svg/svg:circle",
-            dict(cx=x, cy=y),
-        )
+        return MoveAction(xpath=MoveActuator.XPATH, direction=direction)
@@ -53,6 +53,9 @@ window_config = WindowConfiguration(
 class Actuator(_Actuator):
     """Actuator base class, see `EyeActuator` and `MouseActuator` for examples."""
 
+    # moves that are smaller than this (L1 distance in svg units) are not drawn
+    MOVE_THRESHOLD = 0.5
+
     def __init__(
         self,
         element_id: str,
@@ -67,22 +70,25 @@ class Actuator(_Actuator):
         super().__init__()
         self.color = color
         self.xpath = f"//svg:circle[@id='{element_id}']"
+        self._position = None  # last drawn position
+        self._size = None  # last drawn size
+
+    def has_moved(self, x: float, y: float) -> bool:
+        """Whether the given position is far enough from the last drawn position to be worth drawing, if it is then it is recorded as the last drawn position."""
+        if self._position is not None:
+            dx, dy = abs(x - self._position[0]), abs(y - self._position[1])
+            if dx + dy < Actuator.MOVE_THRESHOLD:
+                return False
+        self._position = (x, y)
+        return True
 
     @attempt
     def close_window(self, action: WindowCloseEvent):  # noqa
         return action  # allows the program to exit
 
-    def resize_element(self, size: float):
-        """Resize the element."""
-        return Update.new(xpath=self.xpath, attrs={"r": size})
-
-    def show_element(self):
-        """Show the element."""
-        return Update.new(xpath=self.xpath, attrs={"fill": self.colour})
-
-    def hide_element(self):
-        """Hide the element."""
-        return Update.new(xpath=self.xpath, attrs={"fill": "transparent"})
+    def move_element(self, x: float, y: float):
+        """Move the element, it is drawn at the origin and positioned with a translation."""
+        return Update.new(xpath=self.xpath, attrs={"transform": f"translate({x},{y})"})
 
 
 class EyeActuator(Actuator):
@@ -92,22 +98,43 @@ class EyeActuator(Actuator):
     def move_on_eyetracker(self, action: EyeMotionEvent):
         """Moves the element to the position of the eye. The element will change size depending on fixate/saccade status."""
         x, y = action.position
-        actions = [action, Update.new(xpath=self.xpath, attrs={"cx": x, "cy": y})]
-        if action.fixated:
-            actions.append(self.resize_element(size=10))
-        else:
-            actions.append(self.resize_element(size=20))
-        return actions
+        size = 10 if action.fixated else 20
+        if not self.has_moved(x, y) and size == self._size:
+            return [action]  # nothing visible would change
+        self._size = size
+        # move and resize with a single update
+        attrs = {"transform": f"translate({x},{y})", "r": size}
+        return [action, Update.new(xpath=self.xpath, attrs=attrs)]
 
 
 class MouseActuator(Actuator):
     """Actuator for the mouse."""
 
+    def __init__(self, element_id: str, color: str = "red"):
+        """Constructor.
+
+        Args:
+            element_id (str): element to move.
+            color (str, optional): colour of the element. Defaults to "red".
+        """
+        super().__init__(element_id, color=color)
+        self._mouse_position = None  # latest mouse position this cycle
+
+    def __attempt__(self):  # noqa
+        # many motion events may arrive each cycle, the element is only moved to the latest position
+        if self._mouse_position is None:
+            return []
+        x, y = self._mouse_position
+        self._mouse_position = None
+        if not self.has_moved(x, y):
+            return []
+        return [self.move_element(x, y)]
+
     @attempt
     def move_on_mouse(self, action: MouseMotionEvent):
-        """Moves the element to the position of the mouse."""
-        x, y = action.position
-        return [action, Update.new(xpath=self.xpath, attrs={"cx": x, "cy": y})]
+        """Moves the element to the position of the mouse (once per cycle, see `__attempt__`)."""
+        self._mouse_position = action.position
+        return action
 
 
 class Avatar(_Avatar):
@@ -60,9 +60,14 @@ class BoxGuidanceActuator(GuidanceActuator):
         self._box_stroke_color = box_stroke_color
         self._box_stroke_width = box_stroke_width
         self._guidance_box_id_template = "guidance_box_%s"
-        # ids of each of the guidance boxes that have been created
+        # data shared by all guidance boxes, the action would otherwise convert these to `str` for each box
+        self._guidance_box_data = {
+            "stroke-width": str(box_stroke_width),
+            "stroke": str(box_stroke_color),
+        }
+        # task -> xpath of each of the guidance boxes that have been created
         # TODO they should be removed when `on_remove` is called!
-        self._guidance_boxes = set()
+        self._guidance_boxes = dict()
 
     def on_remove(self, agent: Agent) -> None:  # noqa
         return super().on_remove(agent)  # TODO remove all guidance boxes!
@@ -81,11 +86,30 @@ class BoxGuidanceActuator(GuidanceActuator):
             DrawBoxOnElementAction: action
         """
         # TODO explicit parameters for box data
+        return self._new_guidance_box_action(element_id, **box_data)
+
+    def _new_guidance_box_action(
+        self, element_id: str, **box_data: dict[str, Any]
+    ) -> DrawBoxOnElementAction:
+        # builds the action without attempting it (see `_draw_guidance_box`)
         box_data["id"] = self._guidance_box_id_template % element_id
         return DrawBoxOnElementAction(
             xpath=f"//*[@id='{element_id}']", box_data=box_data
         )
 
+    def _draw_guidance_box(self, task: str, opacity: float) -> list[Action]:
+        if task in self._guidance_boxes:
+            return []
+        # first time! insert the guidance box, its xpath is kept for later show/hide
+        guidance_box_id = self._guidance_box_id_template % task
+        self._guidance_boxes[task] = f"//*[@id='{guidance_box_id}']"
+        # draw the box already shown/hidden, this is attempted by the calling attempt method
+        return [
+            self._new_guidance_box_action(
+                task, opacity=str(opacity), **self._guidance_box_data
+            )
+        ]
+
     @attempt()
     def show_guidance(self, task: str) -> list[Action]:
         """Show guidance on the given task.
@@ -97,22 +121,10 @@ class BoxGuidanceActuator(GuidanceActuator):
             list[Action]: guidance actions
         """
         self._guidance_on = task
-        guidance_box_id = self._guidance_box_id_template % task
-
-        actions = []
-
-        if guidance_box_id not in self._guidance_boxes:
-            # first time! insert the guidance box
-            self._guidance_boxes.add(guidance_box_id)
-            box_data = {
-                "stroke-width": self._box_stroke_width,
-                "stroke": self._box_stroke_color,
-            }
-            # draw the box but it is hidden (opacity=0)
-            actions.append(
-                self.draw_guidance_box_on_element(task, opacity=0.0, **box_data)
-            )
-        actions.append(ShowElementAction(xpath=f"//*[@id='{guidance_box_id}']"))
+        # a new box is drawn visible, there is no need to show it separately
+        actions = self._draw_guidance_box(task, opacity=1.0)
+        if not actions:
+            actions.append(ShowElementAction(xpath=self._guidance_boxes[task]))
         return actions
 
     @attempt()
@@ -126,22 +138,10 @@ class BoxGuidanceActuator(GuidanceActuator):
             list[Action]: guidance actions
         """
         self._guidance_on = None
-        guidance_box_id = self._guidance_box_id_template % task
-
-        actions = []
-
-        if guidance_box_id not in self._guidance_boxes:
-            # first time! insert the guidance box
-            self._guidance_boxes.add(guidance_box_id)
-            box_data = {
-                "stroke-width": self._box_stroke_width,
-                "stroke": self._box_stroke_color,
-            }
-            # draw the box but it is hidden (opacity=0)
-            actions.append(
-                self.draw_guidance_box_on_element(task, opacity=0.0, **box_data)
-            )
-        actions.append(HideElementAction(xpath=f"//*[@id='{guidance_box_id}']"))
+        # a new box is drawn hidden, there is no need to hide it separately
+        actions = self._draw_guidance_box(task, opacity=0.0)
+        if not actions:
+            actions.append(HideElementAction(xpath=self._guidance_boxes[task]))
         return actions
 
 
@@ -155,6 +155,8 @@ class ArrowGuidanceActuator(GuidanceActuator):
     """
 
     ARROW_MODES = Literal["gaze", "mouse", "fixed"]
+    # the guidance arrow is drawn on the root svg element
+    ARROW_PARENT_XPATH = "/svg:svg"
 
     def __init__(
         self,
@@ -188,43 +190,57 @@ class ArrowGuidanceActuator(GuidanceActuator):
                 f"Invalid argument: `arrow_mode` must be one of {ArrowGuidanceActuator.ARROW_MODES}"
             )
         self._guidance_arrow_id = "guidance_arrow"
+        self._guidance_arrow_xpath = f"//*[@id='{self._guidance_arrow_id}']"
+        # validated once here, the per-cycle arrow moves are built from its data (see `_move_guidance_arrow`)
+        self._guidance_arrow_move = DrawArrowAction(
+            xpath=self.ARROW_PARENT_XPATH, data=dict(id=self._guidance_arrow_id)
+        )
         self._guidance_on = None
         self._gaze_position = None
         self._mouse_position = None
+        # the position getter is picked once here rather than checking `arrow_mode` every cycle
+        self._get_arrow_position = {
+            "gaze": self._get_gaze_arrow_position,
+            "mouse": self._get_mouse_arrow_position,
+            "fixed": self._get_fixed_arrow_position,
+        }[self._arrow_mode]
 
     def __attempt__(self):  # noqa
         if self._guidance_on is None:
             return []
-        elif self._arrow_mode == "gaze":
-            # eyetracking positions can be nan, dont update the position if they are?
-            if isfinite(self._gaze_position[0]) and isfinite(self._gaze_position[1]):
-                attrs = dict(
-                    id=self._guidance_arrow_id,
-                    x=self._gaze_position[0] + self._arrow_offset[0],
-                    y=self._gaze_position[1] + self._arrow_offset[0],
-                    point_to=self._guidance_on,
-                )
-                return [DrawArrowAction(xpath="/svg:svg", data=attrs)]
-            else:
-                LOGGER.warning("Ignoring NaN arrow position.")
+        position = self._get_arrow_position()
+        if position is None:
             return []
-        elif self._arrow_mode == "mouse":
-            if self._mouse_position:
-                attrs = dict(
-                    id=self._guidance_arrow_id,
-                    x=self._mouse_position[0] + self._arrow_offset[0],
-                    y=self._mouse_position[1] + self._arrow_offset[0],
-                    point_to=self._guidance_on,
-                )
-                return [DrawArrowAction(xpath="/svg:svg", data=attrs)]
-            return []
-        elif self._arrow_mode == "fixed":
-            # TODO where should it be? the center of the screen?
-            raise NotImplementedError("TODO")
-        else:
-            raise ValueError(
-                f"Invalid argument: `arrow_mode` must be one of {ArrowGuidanceActuator.ARROW_MODES}"
-            )
+        return [self._move_guidance_arrow(position)]
+
+    def _get_gaze_arrow_position(self) -> tuple[float, float] | None:
+        if self._gaze_position is None:
+            return None
+        # eyetracking positions can be nan, dont update the position if they are?
+        if isfinite(self._gaze_position[0]) and isfinite(self._gaze_position[1]):
+            return self._gaze_position
+        LOGGER.warning("Ignoring NaN arrow position.")
+        return None
+
+    def _get_mouse_arrow_position(self) -> tuple[float, float] | None:
+        return self._mouse_position if self._mouse_position else None
+
+    def _get_fixed_arrow_position(self) -> tuple[float, float] | None:
+        # TODO where should it be? the center of the screen?
+        raise NotImplementedError("TODO")
+
+    def _move_guidance_arrow(self, position: tuple[float, float]) -> DrawArrowAction:
+        # this is called every cycle that the arrow moves, the data of `_guidance_arrow_move` was validated when
+        # the actuator was created and only `str` values are added to it, so the validators are not run again
+        data = {
+            **self._guidance_arrow_move.data,
+            "x": str(position[0] + self._arrow_offset[0]),
+            "y": str(position[1] + self._arrow_offset[1]),
+            "point_to": str(self._guidance_on),
+        }
+        return DrawArrowAction.model_construct(
+            xpath=self._guidance_arrow_move.xpath, data=data
+        )
 
     @attempt([EyeMotionEvent])
     def set_gaze_position(self, action: EyeMotionEvent) -> None:
@@ -285,7 +301,7 @@ class ArrowGuidanceActuator(GuidanceActuator):
             DrawArrowAction: action
         """
         return DrawArrowAction(
-            xpath="/svg:svg",
+            xpath=self.ARROW_PARENT_XPATH,
             data=dict(
                 id=name,
                 x=x,
@@ -312,7 +328,7 @@ class ArrowGuidanceActuator(GuidanceActuator):
         """
         self._guidance_on = task
         actions = [
-            ShowElementAction(xpath=f"//*[@id='{self._guidance_arrow_id}']"),
+            ShowElementAction(xpath=self._guidance_arrow_xpath),
         ]
         return actions
 
@@ -328,6 +344,6 @@ class ArrowGuidanceActuator(GuidanceActuator):
         """
         self._guidance_on = None
         actions = [
-            HideElementAction(xpath=f"//*[@id='{self._guidance_arrow_id}']"),
+            HideElementAction(xpath=self._guidance_arrow_xpath),
         ]
         return actions
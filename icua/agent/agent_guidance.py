@@ -40,10 +40,15 @@ class GuidanceAgent(AgentRouted):
             sensors (list[Sensor]): list of sensors, this will typically be a list of `icua.agent.TaskAcceptabilitySensor`s. A `UserInputSensor` will always be added automatically.
             actuators (list[Actuator]): list of actuators, this will typically contain actuators that are capable of providing visual feedback to a user, see e.g. `icua.agent.GuidanceActuator` and its concrete implementations.
             user_input_events (tuple[type[Event]], optional): additional user input events to subscribe to. Defaults to None.
-            user_input_events_history_size (int | list[int], optional): size of the history of user input events to keep, when this size is reached old events will be overwritten. Defaults to 50.
+            user_input_events_history_size (int | list[int], optional): size of the history of user input events to keep, when this size is reached old events will be overwritten. A `list` must contain one size for each of the types in `user_input_types`. Defaults to 50.
+
+        Raises:
+            ValueError: if `user_input_events_history_size` is a `list` that doesn't have a size for each user input type.
         """
         # agent's beliefs store
         self.beliefs = dict()
+        # tasks of the acceptability sensors, this only changes when components are added/removed (see `monitoring_tasks`)
+        self._monitoring_tasks = None
         # this is the guidance agents main sensor, it will sense:
         # user input events (typically) MouseButtonEvent, MouseMotionEvent, KeyEvent
         user_input_events = user_input_events if user_input_events else []
@@ -63,11 +68,20 @@ class GuidanceAgent(AgentRouted):
             user_input_events_history_size = [user_input_events_history_size] * len(
                 user_input_events
             )
+        elif len(user_input_events_history_size) != len(user_input_events):
+            # zip would otherwise silently drop (or misalign) buffers for some types
+            raise ValueError(
+                f"Argument `user_input_events_history_size` must contain a size for each of: {user_input_events}"
+            )
         # TODO use a default dict for this, what if additional subscriptions are made in the UserInputSensor!
         self._user_input_events = {
             t: deque(maxlen=hsize)
             for t, hsize in zip(user_input_events, user_input_events_history_size)
         }
+        # type -> bound `appendleft` of its buffer, used by `on_user_input` for each event
+        self._user_input_appenders = {
+            t: events.appendleft for t, events in self._user_input_events.items()
+        }
         # add an observe method to capture all user input events (based on the UserInputSensor types)
         self.add_observe(self.on_user_input, self.user_input_types)
 
@@ -76,6 +90,13 @@ class GuidanceAgent(AgentRouted):
         # initialise beliefs for the new task
         if isinstance(result, TaskAcceptabilitySensor):
             self.beliefs[result.task_name] = dict(is_active=False, is_acceptable=False)
+            self._monitoring_tasks = None
+        return result
+
+    def remove_component(self, component: Component) -> Component:  # noqa
+        result = super().remove_component(component)
+        if isinstance(result, TaskAcceptabilitySensor):
+            self._monitoring_tasks = None
         return result
 
     @property
@@ -149,12 +170,10 @@ class GuidanceAgent(AgentRouted):
         Returns:
             Iterator[Event]: an iterator that contains the requested events (may be empty if no such events exist).
         """
-        try:
-            return islice(self._user_input_events[event_type], 0, n)
-        except IndexError:
-            return iter([])
-        except KeyError:
+        events = self._user_input_events.get(event_type, None)
+        if events is None:
             return iter([])
+        return islice(events, 0, n)
 
     @observe
     def on_error(
@@ -188,13 +207,16 @@ class GuidanceAgent(AgentRouted):
         Args:
             observation (TaskAcceptabilityObservation): the acceptability observation
         """
-        task = observation.values["task"]
-        was_active = self.beliefs[task]["is_active"]
-        was_acceptable = self.beliefs[task]["is_acceptable"]
-        is_active = observation.values["is_active"]
-        is_acceptable = observation.values["is_acceptable"]
-        self.beliefs[task]["is_active"] = is_active
-        self.beliefs[task]["is_acceptable"] = is_acceptable
+        values = observation.values
+        task = values["task"]
+        # the task's beliefs are looked up once and updated in place
+        beliefs = self.beliefs[task]
+        was_active = beliefs["is_active"]
+        was_acceptable = beliefs["is_acceptable"]
+        is_active = values["is_active"]
+        is_acceptable = values["is_acceptable"]
+        beliefs["is_active"] = is_active
+        beliefs["is_acceptable"] = is_acceptable
         if was_active and not is_active:
             self.on_inactive(task)
         elif not was_active and is_active:
@@ -216,8 +238,8 @@ class GuidanceAgent(AgentRouted):
             observation (Any): the observation.
         """
         # print("USER INPUT:", observation)
-        assert isinstance(observation, self.user_input_types)
-        self._user_input_events[type(observation)].appendleft(observation)
+        # the event router only sends `user_input_types` here, no need to check the type
+        self._user_input_appenders[type(observation)](observation)
 
     @property
     def monitoring_tasks(self) -> set[str]:
@@ -226,7 +248,22 @@ class GuidanceAgent(AgentRouted):
         Returns:
             set[str]: set of tasks that this agent is monitoring.
         """
-        return set([s.task_name for s in self.acceptability_sensors])
+        return set(self._get_monitoring_tasks())
+
+    def _get_monitoring_tasks(self) -> frozenset[str]:
+        if self._monitoring_tasks is None:
+            self._monitoring_tasks = frozenset(
+                s.task_name for s in self.acceptability_sensors
+            )
+        return self._monitoring_tasks
+
+    def _iter_task_beliefs(self) -> Iterator[tuple[str, dict[str, bool]]]:
+        # (task, beliefs) for each monitored task, the beliefs of a task are looked up once
+        beliefs = self.beliefs
+        return ((t, beliefs[t]) for t in self._get_monitoring_tasks())
+
+    # the task properties below are computed in a single pass over the beliefs,
+    # `is_acceptable` is only checked for tasks that are active.
 
     @property
     def active_tasks(self) -> set[str]:
@@ -235,7 +272,7 @@ class GuidanceAgent(AgentRouted):
         Returns:
             set[str]: set of active tasks.
         """
-        return set(t for t in self.monitoring_tasks if self.beliefs[t]["is_active"])
+        return {t for t, b in self._iter_task_beliefs() if b["is_active"]}
 
     @property
     def inactive_tasks(self) -> set[str]:
@@ -244,7 +281,7 @@ class GuidanceAgent(AgentRouted):
         Returns:
             set[str]: set of inactive tasks.
         """
-        return set(t for t in self.monitoring_tasks if not self.beliefs[t]["is_active"])
+        return {t for t, b in self._iter_task_beliefs() if not b["is_active"]}
 
     @property
     def acceptable_tasks(self) -> set[str]:
@@ -253,7 +290,11 @@ class GuidanceAgent(AgentRouted):
         Returns:
             set[str]: set of acceptable tasks.
         """
-        return set(t for t in self.active_tasks if self.beliefs[t]["is_acceptable"])
+        return {
+            t
+            for t, b in self._iter_task_beliefs()
+            if b["is_active"] and b["is_acceptable"]
+        }
 
     @property
     def unacceptable_tasks(self) -> set[str]:
@@ -262,4 +303,8 @@ class GuidanceAgent(AgentRouted):
         Returns:
             set[str]: set of unacceptable tasks.
         """
-        return set(t for t in self.active_tasks if not self.beliefs[t]["is_acceptable"])
+        return {
+            t
+            for t, b in self._iter_task_beliefs()
+            if b["is_active"] and not b["is_acceptable"]
+        }
@@ -28,12 +28,33 @@ class Avatar(PygameAvatar):
             kwargs (dict[str,Any]): additional optional keyword arguments.
         """
         super().__init__(sensors, actuators, window_config=window_config, **kwargs)
+        # (scale_x, scale_y, offset_x, offset_y) pixel -> svg transform, see `pixel_to_svg`
+        self._pixel_to_svg_transform = None
 
     def render(self) -> None:
         """Renders the UI and triggers a `RenderEvent`."""
         # this is for logging purposes, we can see when the rendering beings. if all agents are running locally (and synchronously), then we can assume that all preceeding events in the event log will be visible to the user! this is very useful for post-analysis in experiments.
         self.attempt(RenderEvent())
         super().render()
+        # the window size (and so the svg scaling) may have changed during rendering
+        self._pixel_to_svg_transform = None
+
+    def pixel_to_svg(self, point: tuple[float, float]) -> tuple[float, float]:
+        """Transforms a point from pixel space to svg space. The transform is cached until the next render, which avoids recomputing it for every (high frequency) eyetracking event.
+
+        Args:
+            point (tuple[float, float]): to transform
+
+        Returns:
+            tuple[float, float]: transformed point
+        """
+        if self._pixel_to_svg_transform is None:
+            # the transform is a scale + translation, recover it from two points
+            ox, oy = self._view.pixel_to_svg((0.0, 0.0))
+            px, py = self._view.pixel_to_svg((1.0, 1.0))
+            self._pixel_to_svg_transform = (px - ox, py - oy, ox, oy)
+        sx, sy, ox, oy = self._pixel_to_svg_transform
+        return (point[0] * sx + ox, point[1] * sy + oy)
 
     @observe
     def on_gaze(self, event: EyeMotionEvent):
@@ -45,7 +66,7 @@ class Avatar(PygameAvatar):
         # These events are generated by an EyetrackingIOSensor (if it exists).
         # The position is in pixel-coordinates, we need to transform to SVG coordinates
         # (similar to mouse events).
-        event.position = self._view.pixel_to_svg(event.position_raw)
+        event.position = self.pixel_to_svg(event.position_raw)
         # also find the elements that are under the gaze point
         event.target = self._view.elements_under(event.position, transform=False)
         # attempt the event, this will send it to other subscribing agents
@@ -2,9 +2,10 @@
 
 from abc import abstractmethod
 from typing import Any
+from collections.abc import Callable
 from pydantic import computed_field
 from copy import deepcopy
-from star_ray.agent import Sensor
+from star_ray.agent import Agent, Sensor
 from star_ray.event import Event, Observation, ErrorObservation
 from star_ray_xml import Select
 
@@ -40,20 +41,39 @@ class TaskAcceptabilityObservation(Observation):
 
 
 class TaskAcceptabilitySensor(Sensor):
-    """This `Sensor` can be used by an agent to track the acceptability of a task."""
-
-    def __init__(self, task_name: str, *args: list[Any], **kwargs: dict[str, Any]):
+    """This `Sensor` can be used by an agent to track the acceptability of a task. By default `is_active` and `is_acceptable` are evaluated and a `TaskAcceptabilityObservation` is produced every cycle, see the `evaluate_on_change` and `report_on_change` options."""
+
+    def __init__(
+        self,
+        task_name: str,
+        *args: list[Any],
+        evaluate_on_change: bool = False,
+        report_on_change: bool = False,
+        **kwargs: dict[str, Any],
+    ):
         """Constructor.
 
         Args:
             task_name (str): task to track.
             args (list[Any]): Additional optional arguments.
+            evaluate_on_change (bool, optional): whether `is_active` and `is_acceptable` are only re-evaluated when this sensors beliefs change (see `invalidate_acceptability`) rather than every cycle. This should only be enabled if they depend on nothing but these beliefs. Defaults to False.
+            report_on_change (bool, optional): whether a `TaskAcceptabilityObservation` is only produced when the result differs from the one that was last reported (and when this sensor is first added to an agent) rather than every cycle. Defaults to False.
             kwargs (dict[str,Any]): Additional optionals keyword arguments.
         """
         super().__init__(*args, **kwargs)
         self._task_name = task_name
         self._beliefs = dict()
         self._errors = []
+        # (element_id, xpath, attributes) -> (xpath, attributes) of `sense_element`, these are the same every cycle
+        self._sense_element_cache: dict[tuple, tuple[str, list[str]]] = dict()
+        # observation type -> handler, resolved once per type (see `_on_observation`)
+        self._observation_handlers: dict[type, Callable[[Observation], None]] = dict()
+        # (is_active, is_acceptable) that was last evaluated (see `iter_observations`)
+        self._acceptability = None
+        # whether beliefs have changed since acceptability was last evaluated, see `evaluate_on_change`
+        self._evaluate_on_change = evaluate_on_change
+        self._acceptability_stale = True
+        self._report_on_change = report_on_change
 
     @abstractmethod
     def is_acceptable(self, task: str = None, **kwargs) -> bool:
@@ -86,14 +106,17 @@ class TaskAcceptabilitySensor(Sensor):
         """
 
     def sense_element(
-        self, element_id: str = None, xpath: str = None, attributes: list[str] = None
+        self,
+        element_id: str = None,
+        xpath: str = None,
+        attributes: list[str] | tuple[str, ...] | frozenset[str] = None,
     ) -> Select:
         """Factory for a sensor action that will sense an element with a given `id`.
 
         Args:
             element_id (str, optional): `id` of the element to sense  (if `xpath` is not provided). Defaults to None.
             xpath (str, optional): xpath of the element (if `element_id` is not provided). Defaults to None.
-            attributes (list[str], optional): element attributes to sense. Defaults to None.
+            attributes (list[str] | tuple[str, ...] | frozenset[str], optional): element attributes to sense, callers that sense the same attributes every cycle should pass a `tuple` or `frozenset` as these are used as is to look up the action. Defaults to None.
 
         Raises:
             ValueError: if both `element_id` and `xpath` are provided.
@@ -102,34 +125,49 @@ class TaskAcceptabilitySensor(Sensor):
             Select: the sense action.
         """
         # TODO maybe this could be in a parent class? e.g. an XMLSensor?
-        if element_id is None and xpath is None:
-            raise ValueError("One of: `element_id` or `xpath` must be specified.")
-        elif element_id:
-            xpath = f"//*[@id='{element_id}']"
-        if attributes is None:
-            attributes = []
-        if "id" not in attributes:
-            attributes.append("id")
+        if attributes is not None and not isinstance(attributes, tuple | frozenset):
+            attributes = tuple(attributes)
+        key = (element_id, xpath, attributes)
+        try:
+            xpath, attributes = self._sense_element_cache[key]
+        except KeyError:
+            if element_id is None and xpath is None:
+                raise ValueError("One of: `element_id` or `xpath` must be specified.")
+            elif element_id:
+                xpath = f"//*[@id='{element_id}']"
+            attributes = list(attributes) if attributes else []
+            if "id" not in attributes:
+                attributes.append("id")
+            self._sense_element_cache[key] = (xpath, attributes)
         return Select(xpath=xpath, attrs=attributes)
 
+    def on_add(self, agent: Agent) -> None:  # noqa
+        super().on_add(agent)
+        # the agent has no beliefs about this task yet, make sure they are reported
+        self._acceptability = None
+        self._acceptability_stale = True
+
     def iter_observations(self):  # noqa
         yield from self._errors
         self._errors.clear()
-        is_active = self.is_active(self.task_name)
-        if not is_active:
-            yield TaskAcceptabilityObservation(
-                values=dict(
-                    task=self.task_name, is_active=is_active, is_acceptable=False
-                ),
-            )
-        else:
-            yield TaskAcceptabilityObservation(
-                values=dict(
-                    task=self.task_name,
-                    is_active=is_active,
-                    is_acceptable=self.is_acceptable(),
-                ),
-            )
+        acceptability = self._acceptability
+        # only re-evaluated when beliefs have changed (see `on_observation`)
+        if not self._evaluate_on_change or self._acceptability_stale:
+            self._acceptability_stale = False
+            is_active = self.is_active(self.task_name)
+            is_acceptable = self.is_acceptable() if is_active else False
+            self._acceptability = (is_active, is_acceptable)
+        # the agent may only need to know when something has changed
+        if self._report_on_change and self._acceptability == acceptability:
+            return
+        is_active, is_acceptable = self._acceptability
+        yield TaskAcceptabilityObservation(
+            values=dict(
+                task=self.task_name,
+                is_active=is_active,
+                is_acceptable=is_acceptable,
+            ),
+        )
 
     def __sense__(self) -> list[Event]:  # noqa
         actions = self.sense()
@@ -170,12 +208,22 @@ class TaskAcceptabilitySensor(Sensor):
 
     def _on_observation(self, observation: Observation | ErrorObservation):
         """Method called internally to handle observations."""
-        if isinstance(observation, ErrorObservation):
-            self.on_error_observation(observation)
-        elif isinstance(observation, Observation):
-            self.on_observation(observation)
+        otype = type(observation)
+        try:
+            handler = self._observation_handlers[otype]
+        except KeyError:
+            handler = self._get_observation_handler(otype)
+            self._observation_handlers[otype] = handler
+        handler(observation)
+
+    def _get_observation_handler(self, otype: type) -> Callable[[Observation], None]:
+        # the isinstance chain is only walked the first time an observation type is seen
+        if issubclass(otype, ErrorObservation):
+            return self.on_error_observation
+        elif issubclass(otype, Observation):
+            return self.on_observation
         else:
-            raise TypeError(f"Invalid observation type: {type(observation)}")
+            raise TypeError(f"Invalid observation type: {otype}")
 
     def on_error_observation(self, observation: ErrorObservation):
         """Handle observation errors, which may occur if for example, required task elements are missing during sense actions. By default these error observations will be produced by `iter_observations` delegating the error handling to the agent. Override this method if you want custom behaviour for handling errors.
@@ -186,15 +234,23 @@ class TaskAcceptabilitySensor(Sensor):
         self._errors.append(observation)
 
     def on_observation(self, observation: Observation):
-        """Called when a new observation is received by this sensor. By default this sensors beliefs are updated with this new observation, all observation data (in the field `values`) is added to the `belief` map with the element 'id' as the belief key.
+        """Called when a new observation is received by this sensor. By default this sensors beliefs are updated with this new observation, all observation data (in the field `values`) is added to the `belief` map with the element 'id' as the belief key. If `evaluate_on_change` is set, task acceptability is re-evaluated only if some belief has changed, if overriding this method make sure to call `invalidate_acceptability` when beliefs are updated.
 
         Args:
             observation (Observation): observation to update beliefs with.
         """
         for data in observation.values:
             try:
-                self._beliefs[data.pop("id")] = deepcopy(data)
+                element_id = data.pop("id")
             except KeyError:
                 raise KeyError(
                     f"Observation: {observation} doesn't contain the required `id` attribute."
                 )
+            # the same elements are typically sensed every cycle and rarely change
+            if self._beliefs.get(element_id, None) != data:
+                self._beliefs[element_id] = deepcopy(data)
+                self.invalidate_acceptability()
+
+    def invalidate_acceptability(self):
+        """Forces `is_active` and `is_acceptable` to be re-evaluated next time observations are produced by this sensor. If `evaluate_on_change` is set, this should be called whenever this sensors beliefs (or anything else that acceptability depends on) change."""
+        self._acceptability_stale = True
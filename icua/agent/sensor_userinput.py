@@ -28,10 +28,9 @@ class UserInputSensor(Sensor):
             kwargs (dict[str,Any]): Additional optionals keyword arguments.
         """
         super().__init__(*args, **kwargs)
-        self._subscribe_to = list(USER_INPUT_TYPES)
-        self._subscribe_to.extend(subscribe_to if subscribe_to else [])
-        # remove duplicates if there are any
-        self._subscribe_to = list(set(self._subscribe_to))
+        subscribe_to = subscribe_to if subscribe_to else []
+        # remove duplicates if there are any (keeping the order of the types)
+        self._subscribe_to = list(dict.fromkeys((*USER_INPUT_TYPES, *subscribe_to)))
 
     def __subscribe__(self):  # noqa
         return [Subscribe(topic=event_type) for event_type in self._subscribe_to]
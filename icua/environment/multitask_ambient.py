@@ -5,7 +5,7 @@ from collections.abc import Callable
 from star_ray.event import wrap_observation
 from star_ray.agent import Agent, Actuator
 from star_ray.event import Event, ActiveObservation, ErrorActiveObservation
-from star_ray_xml import Insert, Select, XPathElementsNotFound
+from star_ray_xml import Insert
 from star_ray_pygame import SVGAmbient
 
 from ..event import (
@@ -68,6 +68,12 @@ class MultiTaskAmbient(SVGAmbient):
         """
         # this needs to happen before any call to __update__
         self._event_logger = None
+        # action type -> handler, used to route actions in __update__, see `_get_update_handler`
+        self._update_handlers: dict[type, Callable[[Event], Any]] = {
+            EnableTask: self._enable_task,
+            DisableTask: self._disable_task,
+            **{action_type: self._inert_action for action_type in INERT_ACTIONS},
+        }
         self._initialise_logging(logging_path=logging_path)
         # initialise agents
         agents = agents if agents else []
@@ -173,15 +179,27 @@ class MultiTaskAmbient(SVGAmbient):
         if self._event_logger:
             self._event_logger.log(action)
         # execute the action here or in super()
-        if isinstance(action, EnableTask):
-            return self._enable_task(action)
-        elif isinstance(action, DisableTask):
-            return self._disable_task(action)
-        elif isinstance(action, INERT_ACTIONS):
-            # these actions have no effect but are important for experiment logging
-            return None
-        else:
-            return super().__update__(action)
+        return self._get_update_handler(type(action))(action)
+
+    def _get_update_handler(self, action_type: type) -> Callable[[Event], Any]:
+        try:
+            return self._update_handlers[action_type]
+        except KeyError:
+            # first time seeing this type, it may be a subclass of one of the handled types
+            handler = next(
+                (
+                    h
+                    for t, h in self._update_handlers.items()
+                    if issubclass(action_type, t)
+                ),
+                super().__update__,
+            )
+            self._update_handlers[action_type] = handler
+            return handler
+
+    def _inert_action(self, action: Event) -> None:
+        # these actions have no effect but are important for experiment logging
+        return None
 
     def on_user_input_event(  # noqa
         self,
@@ -210,13 +228,9 @@ class MultiTaskAmbient(SVGAmbient):
         Returns:
             bool: True if the task is enabled (is part of the state), False otherwise.
         """
-        try:
-            result = self._state.select(
-                Select.new(f"/svg:svg/*[@id='{task_name}']", ["id"])
-            )
-        except XPathElementsNotFound:
-            return False
-        return result is not None and len(result) > 0
+        # only the existence of the element matters, there is no need to select (and convert) its attributes
+        # or to raise and catch an error when the task is not enabled (the common case in `_enable_task`)
+        return len(self._state.xpath(f"/svg:svg/*[@id='{task_name}']")) > 0
 
     @wrap_observation
     def _disable_task(self, event: DisableTask):
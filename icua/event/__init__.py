@@ -1,5 +1,6 @@
 """Package defines or includes many useful event classes including task, guidance, UI, user input and XML/SVG related events."""
 
+from typing import get_args
 from star_ray import Event
 
 from star_ray_pygame.event import (
@@ -37,6 +38,7 @@ from .event_guidance import (
     DrawArrowAction,
     DrawBoxAction,
     DrawBoxOnElementAction,
+    SetAttributesAction,
     ShowElementAction,
     HideElementAction,
 )
@@ -46,22 +48,10 @@ from .event_avatar import RenderEvent
 # TODO try-except this?
 from ..extras.eyetracking import EyeMotionEvent, EyeMotionEventRaw
 
-USER_INPUT_TYPES: tuple[type] = (
-    EyeMotionEvent,
-    EyeMotionEventRaw,
-    MouseMotionEvent,
-    MouseButtonEvent,
-    KeyEvent,
-    WindowOpenEvent,
-    WindowCloseEvent,
-    WindowFocusEvent,
-    WindowMoveEvent,
-    WindowResizeEvent,
-    ScreenSizeEvent,
-)
-
 UserInputEvent = (
-    MouseMotionEvent
+    EyeMotionEvent
+    | EyeMotionEventRaw
+    | MouseMotionEvent
     | MouseButtonEvent
     | KeyEvent
     | WindowOpenEvent
@@ -70,10 +60,11 @@ UserInputEvent = (
     | WindowMoveEvent
     | WindowResizeEvent
     | ScreenSizeEvent
-    | EyeMotionEvent
-    | EyeMotionEventRaw
 )
 
+# derived from `UserInputEvent` so that the two cannot drift apart
+USER_INPUT_TYPES: tuple[type] = get_args(UserInputEvent)
+
 
 __all__ = (
     # user input events
@@ -112,6 +103,7 @@ __all__ = (
     "DrawArrowAction",
     "DrawBoxAction",
     "DrawBoxOnElementAction",
+    "SetAttributesAction",
     "ShowElementAction",
     "HideElementAction",
     # misc
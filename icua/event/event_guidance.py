@@ -1,6 +1,7 @@
 """Module defining guidance related events."""
 
-from typing import ClassVar
+from typing import Any, ClassVar
+from functools import lru_cache
 from pydantic import field_validator
 import lxml.etree as etree
 import math
@@ -10,8 +11,6 @@ from star_ray_xml import (
     XMLState,
     XPathQuery,
     insert,
-    update,
-    select,
     XPathElementsNotFound,
 )
 from star_ray_pygame.cairosurface import parse_transform
@@ -27,10 +26,82 @@ __all__ = (
     "DrawArrowAction",
     "DrawBoxAction",
     "DrawBoxOnElementAction",
+    "SetAttributesAction",
     "ShowElementAction",
     "HideElementAction",
 )
 
+# tag of the guidance box elements (see `DrawBoxAction`)
+_RECT_TAG = f"{{{SVGAmbient.DEFAULT_SVG_NAMESPACES['svg']}}}rect"
+# radians -> degrees, used for the rotation of the guidance arrow
+_RAD2DEG = 180.0 / math.pi
+
+
+def _xpath_literal(value: str) -> str:
+    # quote a value for use in an xpath expression, xpath 1.0 has no escape character so values that contain both quote types are built with `concat`
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = (f"'{part}'" for part in value.split("'"))
+    return "concat(" + ', "\'", '.join(parts) + ")"
+
+
+@lru_cache(maxsize=128)
+def _get_id_xpath(element_id: str) -> str:
+    # the xpath of an element with the given id, these are the same every cycle (e.g. the task an arrow points to)
+    return f"//*[@id={_xpath_literal(element_id)}]"
+
+
+def _get_children(parents: list[Any], child_xpath: str) -> list[Any]:
+    # elements at `child_xpath` relative to each of the given `parents`
+    return [
+        child
+        for parent in parents
+        for child in parent.xpath(
+            child_xpath, namespaces=SVGAmbient.DEFAULT_SVG_NAMESPACES
+        )
+    ]
+
+
+@lru_cache(maxsize=64)
+def _get_scale(transform: str | None) -> tuple[float, float]:
+    # scale of a `transform` attribute, these rarely change (e.g. the arrow's scale) so are only parsed once
+    (sx, sy), _, _ = parse_transform(transform)
+    return sx, sy
+
+
+def _get_center(element: Any) -> tuple[float, float]:
+    # center of an element from its position, size and scale
+    get = element.get
+    sx, sy = _get_scale(get("transform"))
+    x = float(get("x")) + float(get("width")) * sx * 0.5
+    y = float(get("y")) + float(get("height")) * sy * 0.5
+    return x, y
+
+
+def _validate_not_none(name: str, data: dict) -> dict[str, str]:
+    # shared by the draw action validators, converts keys and values to `str` in one pass
+    result = dict()
+    for k, v in data.items():
+        if v is None:
+            raise ValueError(f"{name} attribute: {k} cannot be `None`.")
+        result[str(k)] = str(v)
+    return result
+
+
+def _set_attributes(state: XMLState, xpath: str, attrs: dict[str, str]) -> None:
+    """Set attributes on all elements at the given xpath, this is equivalent to `state.update(update(xpath, attrs))` for plain (non-expression) attributes."""
+    elements = state.xpath(xpath)
+    if len(elements) == 0:
+        raise XPathElementsNotFound(
+            "Invalid xpath: `{xpath}` for `update`, no elements were found at this path.",
+            xpath=xpath,
+        )
+    for element in elements:
+        for k, v in attrs.items():
+            element.set(k, v)
+
 
 class TaskAcceptable(Action):
     """This action to be taken when a task goes from an `acceptable` state to an `unacceptable` state."""
@@ -71,15 +142,11 @@ class HideGuidance(Action):
 class XPathAction(XPathQuery):
     """Base class for guidance actions, validates the xpath attribute of XPathQuery."""
 
-    # @validator("xpath", pre=True, always=True)
-    @field_validator("xpath", mode="before")
+    # the `str` type check is done by pydantic-core, only the trailing "/" is handled here
+    @field_validator("xpath", mode="after")
     @classmethod
-    def _validate_xpath(cls, xpath):
-        if not isinstance(xpath, str):
-            raise TypeError(f"Invalid xpath: '{xpath}', must be of type `str`")
-        if xpath.endswith("/"):
-            xpath = xpath[:-1]
-        return xpath
+    def _validate_xpath(cls, xpath: str):
+        return xpath.removesuffix("/")
 
     @property
     def is_read(self):  # noqa: D102
@@ -101,9 +168,8 @@ class XPathAction(XPathQuery):
 class DrawElementAction(XPathAction):
     data: dict[str, str]
 
-    REQUIRED_DATA: ClassVar[tuple[str]] = tuple()
+    REQUIRED_DATA: ClassVar[frozenset[str]] = frozenset()
 
-    # @validator("data", pre=True, always=True)
     @field_validator("data", mode="before")
     @classmethod
     def _validate_data(cls, data):
@@ -112,22 +178,14 @@ class DrawElementAction(XPathAction):
 
     @classmethod
     def _validate_none_data(cls, data):
-        def _validate(data):
-            for k, v in data.items():
-                if v is None:
-                    raise ValueError(
-                        f"{DrawBoxAction.__name__} attribute: {k} cannot be `None`."
-                    )
-                yield str(k), str(v)
-
-        return dict(_validate(data))
+        return _validate_not_none(DrawBoxAction.__name__, data)
 
     @classmethod
     def _validate_required_data(cls, data):
-        if not all(x in data for x in cls.REQUIRED_DATA):
-            missing = [x for x in cls.REQUIRED_DATA if x not in data]
+        missing = cls.REQUIRED_DATA.difference(data)
+        if missing:
             raise ValueError(
-                f"{DrawBoxAction.__name__} is missing attributes: {missing}"
+                f"{DrawBoxAction.__name__} is missing attributes: {sorted(missing)}"
             )
         return data
 
@@ -156,7 +214,18 @@ class DrawArrowAction(DrawElementAction):
     ARROW_SVG: ClassVar[str] = (
         """<svg:svg xmlns:svg="http://www.w3.org/2000/svg" transform="scale({scale})" id="{id}" x="{x}" y="{y}" opacity="{opacity}" viewBox="-28 -28 178 178" width="200" height="200"><svg:polygon transform="rotate({rotation}, 61.44, 61.44)" fill="{fill}" stroke="{stroke}" stroke-width="{stroke_width}" points="148.33, 61.44 32.07, 118.96 62.71, 61.44 32.07, 3.92 148.33, 61.44" /> </svg:svg>"""
     )
-    REQUIRED_DATA: ClassVar[tuple[str]] = ("id",)
+    REQUIRED_DATA: ClassVar[frozenset[str]] = frozenset(("id",))
+    # (key, default) pairs for optional data used when a new arrow is inserted
+    DEFAULT_DATA: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("fill", "none"),
+        ("opacity", "1"),
+        ("stroke", "#ff0000"),
+        ("scale", "1"),
+        ("rotation", "0"),
+        ("stroke_width", "2.0"),
+        ("x", "0"),
+        ("y", "0"),
+    )
 
     @classmethod
     def new_rotation(cls, rotation: float) -> str:
@@ -170,95 +239,95 @@ class DrawArrowAction(DrawElementAction):
 
     @classmethod
     def _insert(cls, state: XMLState, data: dict[str, str], xpath: str):
-        data.setdefault("fill", "none")
-        data.setdefault("opacity", "1")
-        data.setdefault("stroke", "#ff0000")
-        data.setdefault("scale", "1")
-        data.setdefault("rotation", "0")
-        data.setdefault("stroke_width", "2.0")
-        data.setdefault("x", "0")
-        data.setdefault("y", "0")
+        for k, v in DrawArrowAction.DEFAULT_DATA:
+            data.setdefault(k, v)
         element = DrawArrowAction.ARROW_SVG.format(**data)
         return state.insert(insert(xpath, element, index=10))
 
     @classmethod
-    def _set_if(cls, attr: str, element: etree.ElementBase, data: dict[str, str]):
+    def _set_if(cls, attr: str, element: Any, data: dict[str, str]):
         if attr in data:
             element.set(attr, data[attr])
 
     @classmethod
     def _update(cls, state: XMLState, data: dict[str, str], xpath: str):
-        pol_data = {
-            k.replace("_", "-"): data[k]
-            for k in ("fill", "stroke", "stroke_width")
-            if k in data
-        }
-        if "scale" in data:
-            transform = DrawArrowAction.new_scale(data["scale"])
-            state.update(update(xpath=xpath, attrs={"transform": "transform"}))
-
-        # update x and y, using x and y as the center coordinates
-        if "x" in data or "y" in data:
-            x, y = data.get("x", None), data.get("y", None)
-            size, _ = DrawArrowAction.get_size_scale(state, xpath)
-            attrs = {k: data[k] for k in ("opacity",) if k in data}
-            if x is not None:
-                attrs["x"] = str(float(x) - size[0] / 2)
-            if y is not None:
-                attrs["y"] = str(float(y) - size[1] / 2)
-            state.update(update(xpath=xpath, attrs=attrs))
-
-        if "rotation" in data:
-            pol_data["transform"] = DrawArrowAction.new_rotation(data["rotation"])
-        pol_xpath = xpath + "/svg:polygon"
-        state.update(update(xpath=pol_xpath, attrs=pol_data))
-
-        # check if we need to update the arrow to point to a target
+        # the arrow (and its polygon) are resolved once and updated in place
+        elements = state.xpath(xpath)
+        if len(elements) == 0:
+            raise XPathElementsNotFound(
+                "Invalid xpath: `{xpath}` for `update`, no elements were found at this path.",
+                xpath=xpath,
+            )
+        cls._update_elements(state, data, elements)
+
+    @classmethod
+    def _update_elements(
+        cls, state: XMLState, data: dict[str, str], elements: list[Any]
+    ):
+        # check if we need to update the arrow to point to a target, the target is resolved
+        # once here so that each arrow (and its polygons) is only visited once below
         point_to = data.get("point_to", None)
         if point_to:
-            rotation = DrawArrowAction.rotation_from_point_to(state, point_to, xpath)
-            transform = DrawArrowAction.new_rotation(rotation)
-            state.update(update(xpath=pol_xpath, attrs={"transform": transform}))
+            x2, y2 = DrawArrowAction.get_element_center(state, _get_id_xpath(point_to))
+        for element in elements:
+            if "scale" in data:
+                element.set("transform", DrawArrowAction.new_scale(data["scale"]))
+            cls._set_if("opacity", element, data)
+            # update x and y, using x and y as the center coordinates
+            if "x" in data or "y" in data:
+                sx, sy = _get_scale(element.get("transform"))
+                if "x" in data:
+                    width = float(element.get("width")) * sx
+                    element.set("x", str(float(data["x"]) - width / 2))
+                if "y" in data:
+                    height = float(element.get("height")) * sy
+                    element.set("y", str(float(data["y"]) - height / 2))
+            # pointing to a target takes precedence over `rotation`
+            rotation = None
+            if point_to:
+                x1, y1 = _get_center(element)
+                rotation = math.atan2(y2 - y1, x2 - x1) * _RAD2DEG
+            elif "rotation" in data:
+                rotation = data["rotation"]
+            for polygon in _get_children([element], "./svg:polygon"):
+                for k in ("fill", "stroke"):
+                    cls._set_if(k, polygon, data)
+                if "stroke_width" in data:
+                    polygon.set("stroke-width", data["stroke_width"])
+                if rotation is not None:
+                    polygon.set("transform", DrawArrowAction.new_rotation(rotation))
 
     @classmethod
     def _draw(cls, state: XMLState, data: dict[str, str], xpath: str):
-        _id = data.get("id", None)
-        assert _id is not None  # must have an 'id'
-        # does the element already exist?
-        uxpath = xpath + f"/svg:svg[@id='{data['id']}']"
-        try:
-            state.select(select(xpath=uxpath, attrs=["id"]))
-        except XPathElementsNotFound:
+        # does the element already exist? (`id` is required, see `REQUIRED_DATA`)
+        child_xpath = f"./svg:svg[@id={_xpath_literal(data['id'])}]"
+        elements = _get_children(state.xpath(xpath), child_xpath)
+        if not elements:
             # it doesnt exist, create it
             return cls._insert(state, data, xpath)
-        # it already exists, update it
-        cls._update(state, data, uxpath)
+        # it already exists, update it (the elements were found above)
+        cls._update_elements(state, data, elements)
 
     @staticmethod
     def get_size_scale(state: XMLState, xpath: str):
         """TODO this should be a utility method."""
-        result = state.select(
-            select(xpath, attrs=["x", "y", "width", "height", "transform"])
-        )
-        if not result:
+        # the attributes are read directly from the element, see `get_element_center`
+        elements = state.xpath(xpath)
+        if not elements:
             raise ValueError(f"Element at xpath: {xpath} doesn't exist")
-        values = result[0]
-        scale, _, _ = parse_transform(values["transform"])
-        return (values["width"] * scale[0], values["height"] * scale[1]), scale
+        get = elements[0].get
+        scale = _get_scale(get("transform"))
+        width, height = float(get("width")), float(get("height"))
+        return (width * scale[0], height * scale[1]), scale
 
     @staticmethod
     def get_element_center(state: XMLState, xpath: str):
         """TODO this should be a utility method."""
-        result = state.select(
-            select(xpath, attrs=["x", "y", "width", "height", "transform"])
-        )
-        if not result:
+        # the attributes are read directly from the element, this is called every cycle when the arrow is pointing at a task
+        elements = state.xpath(xpath)
+        if not elements:
             raise ValueError(f"Element at xpath: {xpath} doesn't exist")
-        values = result[0]
-        x, y = (float(values["x"]), float(values["y"]))
-        scale, _, _ = parse_transform(values["transform"])
-        width, height = (values["width"] * scale[0], values["height"] * scale[1])
-        return x + width / 2, y + height / 2
+        return _get_center(elements[0])
 
     @staticmethod
     def rotation_from_point_to(state: XMLState, element_id: str, xpath: str) -> float:
@@ -276,25 +345,30 @@ class DrawArrowAction(DrawElementAction):
         # get the center of the arrow
         (x1, y1) = DrawArrowAction.get_element_center(state, xpath)
         # get the center of the element with id `element_id`
-        (x2, y2) = DrawArrowAction.get_element_center(
-            state, f".//*[@id='{element_id}']"
-        )
+        (x2, y2) = DrawArrowAction.get_element_center(state, _get_id_xpath(element_id))
         # compute angle between points
-        return math.degrees(math.atan2(y2 - y1, x2 - x1))
+        return math.atan2(y2 - y1, x2 - x1) * _RAD2DEG
 
 
-class ShowElementAction(XPathAction):
-    """Action to show an element by setting its opacity to 1."""
+class SetAttributesAction(XPathAction):
+    """Base class for actions that set a fixed collection of attributes (`ATTRIBUTES`) on the elements at `xpath`, see e.g. `ShowElementAction`. Subclasses only need to define `ATTRIBUTES`, they share a single execution path."""
+
+    ATTRIBUTES: ClassVar[dict[str, str]] = {}
 
     def __execute__(self, state: XMLState):  # noqa
-        return state.update(update(self.xpath, attrs={"opacity": 1}))
+        return _set_attributes(state, self.xpath, type(self).ATTRIBUTES)
 
 
-class HideElementAction(XPathAction):
+class ShowElementAction(SetAttributesAction):
+    """Action to show an element by setting its opacity to 1."""
+
+    ATTRIBUTES: ClassVar[dict[str, str]] = {"opacity": "1"}
+
+
+class HideElementAction(SetAttributesAction):
     """Action to hide an element by setting its opacity to 0."""
 
-    def __execute__(self, state: XMLState):  # noqa
-        return state.update(update(self.xpath, attrs={"opacity": 0}))
+    ATTRIBUTES: ClassVar[dict[str, str]] = {"opacity": "0"}
 
 
 class DrawBoxAction(XPathAction):
@@ -302,7 +376,16 @@ class DrawBoxAction(XPathAction):
 
     box_data: dict[str, str]
 
-    # @validator("box_data", pre=True, always=True)
+    REQUIRED_BOX_DATA: ClassVar[frozenset[str]] = frozenset(
+        ("x", "y", "width", "height")
+    )
+    # (key, default) pairs for optional data used when a new box is inserted
+    DEFAULT_BOX_DATA: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("stroke-width", "2"),
+        ("stroke", "#ff0000"),
+        ("fill", "none"),
+    )
+
     @field_validator("box_data", mode="before")
     @classmethod
     def _validate_box_data(cls, data):
@@ -311,32 +394,23 @@ class DrawBoxAction(XPathAction):
 
     @classmethod
     def _validate_none_box_data(cls, data):
-        def _validate(data):
-            for k, v in data.items():
-                if v is None:
-                    raise ValueError(
-                        f"{DrawBoxAction.__name__} attribute: {k} cannot be None"
-                    )
-                yield str(k), str(v)
-
-        return dict(_validate(data))
+        return _validate_not_none(DrawBoxAction.__name__, data)
 
     @classmethod
     def _validate_required_box_data(cls, data: dict[str, str]):
-        if not all(x in data for x in ("x", "y", "width", "height")):
-            missing = [x for x in ("x", "y", "width", "height") if x not in data]
+        missing = DrawBoxAction.REQUIRED_BOX_DATA.difference(data)
+        if missing:
             raise ValueError(
-                f"{DrawBoxAction.__name__} is missing attributes: {missing}"
+                f"{DrawBoxAction.__name__} is missing attributes: {sorted(missing)}"
             )
         return data
 
     @staticmethod
     def _new_box(state: XMLState, box_data: dict[str, str], xpath: str):
-        box_data.setdefault("stroke-width", "2")
-        box_data.setdefault("stroke", "#ff0000")
-        box_data.setdefault("fill", "none")
+        for k, v in DrawBoxAction.DEFAULT_BOX_DATA:
+            box_data.setdefault(k, v)
         box = etree.Element(
-            f"{{{SVGAmbient.DEFAULT_SVG_NAMESPACES['svg']}}}rect",
+            _RECT_TAG,
             attrib=box_data,
             nsmap=SVGAmbient.DEFAULT_SVG_NAMESPACES,
         )
@@ -344,18 +418,28 @@ class DrawBoxAction(XPathAction):
         return state.insert(insert(xpath=xpath, element=box, index=0))
 
     @staticmethod
-    def _draw_box(state: XMLState, box_data: dict[str, str], xpath: str):
-        box_id = box_data.get("id", None)
-        if box_id is None:
-            raise ValueError("Attempted to draw a box without an `id` attribute.")
-        # check if the box already exists
-        uxpath = xpath + f"/svg:rect[@id='{box_id}']"
+    def _update_box(
+        state: XMLState, box_data: dict[str, str], parents: list[Any]
+    ) -> bool:
+        # updates the box if it already exists in one of `parents`, returns whether it did
         try:
-            state.select(select(xpath=uxpath, attrs=["id"]))
-        except XPathElementsNotFound:
+            box_id = box_data["id"]
+        except KeyError:
+            raise ValueError(
+                "Attempted to draw a box without an `id` attribute."
+            ) from None
+        boxes = _get_children(parents, f"./svg:rect[@id={_xpath_literal(box_id)}]")
+        for box in boxes:
+            for k, v in box_data.items():
+                box.set(k, v)
+        return len(boxes) > 0
+
+    @staticmethod
+    def _draw_box(state: XMLState, box_data: dict[str, str], xpath: str):
+        parents = state.xpath(xpath)
+        if not DrawBoxAction._update_box(state, box_data, parents):
             # create a new box (it doesnt exist yet)
             return DrawBoxAction._new_box(state, box_data, xpath)
-        return state.update(update(xpath=uxpath, attrs=box_data))
 
     def __execute__(self, state: XMLState):  # noqa
         return DrawBoxAction._draw_box(state, self.box_data, self.xpath)
@@ -364,30 +448,52 @@ class DrawBoxAction(XPathAction):
 class DrawBoxOnElementAction(DrawBoxAction):
     """TODO."""
 
-    # @validator("box_data", pre=True, always=True)
     @field_validator("box_data", mode="before")
     @classmethod
     def _validate_box_data(cls, data):
         return DrawBoxAction._validate_none_box_data(data)
 
+    # attributes of the element that give the position and size of the box
+    ELEMENT_ATTRIBUTES: ClassVar[tuple[str, ...]] = ("x", "y", "width", "height")
+
     def __execute__(self, state: XMLState):  # noqa
-        required_attrs = ("x", "y", "width", "height")
-        result = state.select(select(xpath=self.xpath, attrs=required_attrs))
-        if not result:
-            raise ValueError(
-                f"Failed to find element at xpath: {self.xpath} for box draw."
+        elements = state.xpath(self.xpath)
+        if not elements:
+            raise XPathElementsNotFound(
+                "Invalid xpath: `{xpath}` for box draw, no elements were found at this path.",
+                xpath=self.xpath,
             )
-        if len(result) > 1:
+        if len(elements) > 1:
             raise ValueError(
                 f"Found multiple elements at xpath: {self.xpath} for box draw."
             )
+        element = elements[0]
+        get = element.get
+        # the element's attributes are merged into a copy of `box_data` in a single pass
+        box_data = dict(self.box_data)
         try:
-            result = DrawBoxAction._validate_none_box_data(result[0])
-            box_data = {**self.box_data}
-            box_data.update(result)
-            box_data = DrawBoxAction._validate_required_box_data(box_data)
+            for k in DrawBoxOnElementAction.ELEMENT_ATTRIBUTES:
+                v = get(k)
+                if v is None:
+                    raise ValueError(
+                        f"{DrawBoxAction.__name__} attribute: {k} cannot be `None`."
+                    )
+                box_data[k] = str(v)
+            DrawBoxAction._validate_required_box_data(box_data)
         except ValueError as e:
             raise ValueError(
                 f"Failed to validate action {DrawBoxOnElementAction.__name__} for element at xpath: {self.xpath}"
             ) from e
-        DrawBoxAction._draw_box(state, box_data, self.xpath + "/parent::*")
+        # the box is drawn in the element's parent (if it has one)
+        parent = element.get_parent()
+        parents = [parent] if parent is not None else []
+        if not DrawBoxAction._update_box(state, box_data, parents):
+            # the parent is inserted into by id (if it has one) rather than searching from the element again
+            parent_id = (
+                parent.get_attributes().get("id") if parent is not None else None
+            )
+            if parent_id is None:
+                parent_xpath = self.xpath + "/parent::*"
+            else:
+                parent_xpath = _get_id_xpath(parent_id)
+            DrawBoxAction._new_box(state, box_data, parent_xpath)
@@ -59,40 +59,36 @@ def merge_intervals(intervals: np.ndarray, *extra: np.ndarray) -> np.ndarray:
         intervals (np.ndarray): intervals to merge.
         extra (tuple[np.ndarray], optional): additional array(s) of intervals to merge. The result will be a single array containing merged intervals from `intervals` and `extra`.
 
+    Raises:
+        ValueError: if any of the given intervals are not of shape (n,2).
+
     Returns:
         np.ndarray: merged intervals
     """
 
     def _normalise_types(inter):
         if len(inter) == 0:
-            array = np.array([]).reshape(0, 2)
-        else:
-            array = np.array(intervals)
-        assert len(array.shape) == 2
-        assert array.shape[1] == 2
+            return np.array([]).reshape(0, 2)
+        array = np.asarray(inter)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError(
+                f"Invalid intervals: expected an array of shape (n,2), received shape {array.shape}"
+            )
         return array
 
     intervals = np.concatenate([_normalise_types(i) for i in (intervals, *extra)])
     sorted_intervals = intervals[intervals[:, 0].argsort()]
     starts = sorted_intervals[:, 0]
-    ends = sorted_intervals[:, 1]
-    merged_intervals = []
-    current_start = starts[0]
-    current_end = ends[0]
-
-    for i in range(1, len(starts)):
-        # If the next interval overlaps or touches, merge it
-        if starts[i] <= current_end:
-            current_end = max(current_end, ends[i])  # Update the current interval's end
-        else:
-            # If there is no overlap, append the current interval and start a new one
-            merged_intervals.append([current_start, current_end])
-            current_start = starts[i]
-            current_end = ends[i]
-
-    # Append the last interval
-    merged_intervals.append([current_start, current_end])
-    return np.array(merged_intervals)
+    # the furthest end reached so far, an interval that starts after this begins a new merged interval
+    ends = np.maximum.accumulate(sorted_intervals[:, 1])
+    is_first = np.empty(len(starts), dtype=bool)
+    is_first[0] = True
+    # If the next interval overlaps or touches, merge it
+    np.greater(starts[1:], ends[:-1], out=is_first[1:])
+    first = np.flatnonzero(is_first)
+    # the last interval in each group has the largest end (see above)
+    last = np.append(first[1:] - 1, len(starts) - 1)
+    return np.stack((starts[first], ends[last]), axis=1)
 
 
 def dedup(df: pd.DataFrame, col: str) -> pd.DataFrame:
@@ -115,11 +111,17 @@ def isin_intervals(timestamps: np.ndarray, intervals: np.ndarray) -> np.ndarray:
         timestamps (np.ndarray): a 1D array of timestamps.
         intervals (np.ndarray): a 2D array of intervals, where each row is an interval (start, end).
 
+    Raises:
+        ValueError: if `intervals` is not of shape (n,2).
+
     Returns:
         np.ndarray: a 1D boolean array which is True for each timestamp that is within an interval.
     """
-    assert len(intervals.shape) == 2
-    assert intervals.shape[1] == 2
+    # explicit checks, asserts are stripped when running with -O
+    if intervals.ndim != 2 or intervals.shape[1] != 2:
+        raise ValueError(
+            f"Invalid intervals: expected an array of shape (n,2), received shape {intervals.shape}"
+        )
     # TODO this is quite slow for many intervals... can do it faster if we sort the arrays
     result = np.zeros(timestamps.shape, dtype=bool)
     for start, end in intervals:
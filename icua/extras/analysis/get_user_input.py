@@ -124,14 +124,25 @@ def get_attention_intervals(
             yield task, pd.DataFrame(columns=["t1", "t2"]).to_numpy()
         return
 
+    tasks = frozenset(tasks)
+    # targets -> attended task, consecutive events typically have the same targets (e.g. during a fixation)
+    attending = dict()
+
     def _get_attending_task(targets: list[str]) -> str:
-        attending_task = set(targets) & tasks
+        key = tuple(targets)
+        try:
+            return attending[key]
+        except KeyError:
+            pass
+        attending_task = tasks.intersection(targets)
         if len(attending_task) == 0:
-            return "none"
+            task = "none"
         elif len(attending_task) == 1:
-            return attending_task.pop()
+            (task,) = attending_task
         else:
             raise ValueError(f"Multiple tasks attended at once: {attending_task}")
+        attending[key] = task
+        return task
 
     df = df.copy()  # avoid possible warning setting value on slice
     # using the target column
@@ -34,8 +34,10 @@ def plot_intervals(
     if intervals.shape[0] == 0:
         return _get_fig_ax(ax)[0]
 
-    assert len(intervals.shape) == 2
-    assert intervals.shape[1] == 2
+    if intervals.ndim != 2 or intervals.shape[1] != 2:
+        raise ValueError(
+            f"Invalid intervals: expected an array of shape (n,2), received shape {intervals.shape}"
+        )
     fig, ax = _get_fig_ax(ax)
     for interval in intervals:
         ax.axvspan(
@@ -7,7 +7,7 @@ See:
 
 from .eyetrackerbase import EyetrackerBase
 from .event import EyeMotionEvent, EyeMotionEventRaw
-from .filter import IVTFilter, NWMAFilter, WindowSpaceFilter
+from .filter import IVTFilter, NWMAFilter, WindowSpaceFilter, ivt_classify
 from .sensor import EyetrackerIOSensor
 
 # requires extra "tobii"
@@ -22,6 +22,7 @@ __all__ = (
     "IVTFilter",
     "NWMAFilter",
     "WindowSpaceFilter",
+    "ivt_classify",
     # eyetracker base
     "EyetrackerBase",
     "tobii",  # tobii base eyetracker
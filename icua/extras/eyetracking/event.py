@@ -1,6 +1,5 @@
 """Module contains eyetracking event classes: `EyeMotionEvent` and `EyeMotionEventRaw`, see class documentation for details."""
 
-from pydantic import Field
 from star_ray.event import Event
 
 __all__ = ("EyeMotionEvent", "EyeMotionEventRaw")
@@ -33,4 +32,4 @@ class EyeMotionEvent(Event):
     position_screen: tuple[float, float] | tuple[int, int] | None
     fixated: bool
     in_window: bool
-    target: list[str] | None = Field(default_factory=lambda: None)
+    target: list[str] | None = None
@@ -1,11 +1,13 @@
 """Module defines some common eyetracking filters that can be used with an `Eyetracker`.
 
-Filter classes:
+Filter classes (these define `__slots__` as their attributes are accessed for every sample):
 - `NanValidator`
 - `NWMAFilter` (Non-weighted Moving Average Filter)
 - `IVTFilter` (Velocity-Threshold Identification Filter)
 - `WindowSpaceFilter`
 
+The `ivt_classify` function implements the I-VT state machine (with minimum fixation duration) over arrays of velocities, it will be compiled with `numba` if it is installed (requires extra "numba").
+
 See class documentation for details.
 """
 
@@ -13,14 +15,91 @@ from typing import Any
 from collections import deque
 import math
 import time
+import numpy as np
 from ...utils import LOGGER
 
-__all__ = ("NWMAFilter", "WindowSpaceFilter", "IVTFilter", "NanValidator")
+try:
+    from numba import njit
+
+    NUMBA_AVALIABLE = True
+except ModuleNotFoundError:
+    NUMBA_AVALIABLE = False
+
+    def njit(*args, **kwargs):  # noqa
+        # fallback when `numba` is not installed, functions are left as pure python
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fun: fun
+
+
+__all__ = (
+    "NWMAFilter",
+    "WindowSpaceFilter",
+    "IVTFilter",
+    "NanValidator",
+    "ivt_classify",
+    "FIXATION",
+    "SACCADE",
+)
+
+# labels used by `ivt_classify`
+FIXATION = 0
+SACCADE = 1
+
+
+@njit(cache=True)
+def ivt_classify(
+    velocity: np.ndarray,
+    timestamps: np.ndarray,
+    velocity_threshold: float,
+    min_fixation_duration: float,
+    fixation_start: float = math.nan,
+) -> tuple[np.ndarray, float]:
+    """Classify each sample as a fixation or saccade using the I-VT state machine. Samples with a velocity below the threshold are fixations, fixations that are shorter than `min_fixation_duration` are reclassified as saccades. A fixation that is still ongoing at the end of the arrays is left as is, its duration is not yet known. NaN velocities are treated as saccades.
+
+    The state machine may be continued over consecutive batches of samples by passing the `fixation_start` returned for the previous batch, a fixation that spans batches is then measured from its true start. Only samples in the current batch are reclassified.
+
+    Args:
+        velocity (np.ndarray): contiguous float64 array of shape (N,) containing the speed of each sample.
+        timestamps (np.ndarray): contiguous float64 array of shape (N,) containing the timestamp of each sample.
+        velocity_threshold (float): velocity threshold used to determine whether the eye is fixated or saccading.
+        min_fixation_duration (float): minimum duration of a fixation.
+        fixation_start (float, optional): timestamp at which the ongoing fixation started, NaN if the eye is not fixated (the initial state). Defaults to NaN.
+
+    Returns:
+        tuple[np.ndarray, float]: int8 array of shape (N,) containing the label (`FIXATION` or `SACCADE`) of each sample, and the timestamp at which the fixation that is ongoing at the end of the arrays started (NaN if there is none).
+    """
+    n = velocity.shape[0]
+    labels = np.empty(n, dtype=np.int8)
+    # index of the first sample of the ongoing fixation, 0 if it started in a previous batch
+    start = 0
+    for i in range(n):
+        if velocity[i] <= velocity_threshold:
+            labels[i] = FIXATION
+            if math.isnan(fixation_start):
+                fixation_start = timestamps[i]
+                start = i
+        else:
+            labels[i] = SACCADE
+            if not math.isnan(fixation_start):
+                if timestamps[i] - fixation_start < min_fixation_duration:
+                    labels[start:i] = SACCADE
+                fixation_start = math.nan
+    return labels, fixation_start
 
 
 class NanValidator:
     """A filter that validates the stream of eyetracking events. It looks for long periods of inactivity or continuous Nan values, and if these reach a duration threshold then an error or warning is raised."""
 
+    __slots__ = (
+        "_duration",
+        "_start_time",
+        "_last_event",
+        "_should_warn",
+        "_should_error",
+        "_nan_count",
+    )
+
     def __init__(
         self, duration: float, should_warn: bool = True, should_error: bool = False
     ):
@@ -72,6 +151,33 @@ class NanValidator:
                 self._bad_eyetracker(bad_duration)
         return data
 
+    def batch(self, positions: np.ndarray) -> None:
+        """Checks a batch of eyetracking positions for long periods of inactivity or NaN values, see `__call__` for details. The positions are assumed to have been received at the same (current) time.
+
+        Args:
+            positions (np.ndarray): array of shape (N, 2) containing eye gaze positions.
+        """
+        is_nan = np.isnan(np.asarray(positions, dtype=np.float64).reshape(-1, 2)).any(
+            axis=1
+        )
+        if is_nan.shape[0] == 0:
+            return
+        now = time.time()
+        if self._last_event is not None:
+            if now - self._last_event > self._duration:
+                self._bad_eyetracker(now - self._last_event)
+        self._last_event = now
+        self._nan_count += int(is_nan.sum())
+        # a run of nan values from a previous batch continues into this one
+        if is_nan[0] and self._start_time is not None:
+            bad_duration = now - self._start_time
+            if bad_duration > self._duration:
+                self._bad_eyetracker(bad_duration)
+        if not is_nan[-1]:
+            self._start_time = None
+        elif self._start_time is None or not is_nan.all():
+            self._start_time = now  # a new run of nan values started in this batch
+
     def _bad_eyetracker(self, bad_duration: float):
         if self._should_warn:
             LOGGER.warning(
@@ -86,6 +192,8 @@ class NanValidator:
 class NWMAFilter:  # Non-weighted moving average
     """Filter that computes a moving average over eye gaze positions for some window size."""
 
+    __slots__ = ("data_x", "data_y")
+
     def __init__(self, n: int):
         """Constructor.
 
@@ -116,6 +224,34 @@ class NWMAFilter:  # Non-weighted moving average
         data["position"] = (x, y)
         return data
 
+    def batch(self, positions: np.ndarray) -> np.ndarray:
+        """Compute the moving average for a batch of positions in a single vectorised pass. This is equivalent to calling the filter on each position in order and shares its state with `__call__`. NaN positions are ignored and are left unchanged in the result.
+
+        Args:
+            positions (np.ndarray): array of shape (N, 2) containing eye gaze positions.
+
+        Returns:
+            np.ndarray: array of shape (N, 2) containing the filtered positions.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        result = positions.copy()
+        valid = ~np.isnan(positions).any(axis=1)
+        if not valid.any():
+            return result
+        n = self.data_x.maxlen
+        history = np.column_stack((self.data_x, self.data_y)).reshape(-1, 2)
+        x = np.concatenate((history, positions[valid]))
+        # the window sums are differences of the cumulative sum, windows are truncated until `n` samples have been seen
+        csum = np.concatenate((np.zeros((1, 2)), np.cumsum(x, axis=0)))
+        end = np.arange(history.shape[0] + 1, x.shape[0] + 1)
+        start = np.maximum(end - n, 0)
+        result[valid] = (csum[end] - csum[start]) / (end - start)[:, None]
+        # keep the most recent positions for the next call
+        tail = x[-n:]
+        self.data_x.extend(tail[:, 0].tolist())
+        self.data_y.extend(tail[:, 1].tolist())
+        return result
+
     def __str__(self) -> str:  # noqa
         return f"{NWMAFilter}(N={len(self.data_x)})"
 
@@ -126,6 +262,13 @@ class NWMAFilter:  # Non-weighted moving average
 class WindowSpaceFilter:
     """Filter that will transform eye gaze positions from screen space to window coordinate space."""
 
+    __slots__ = (
+        "_screen_size",
+        "_window_size",
+        "_window_position",
+        "_keep_screen_data",
+    )
+
     def __init__(
         self,
         screen_size: tuple[float, float],
@@ -147,6 +290,35 @@ class WindowSpaceFilter:
         self.window_position = window_position
         self._keep_screen_data = keep_screen_data
 
+    # the screen/window information is stored as plain tuples of floats, they are unpacked for every sample
+
+    @property
+    def screen_size(self) -> tuple[float, float]:
+        """Size of the screen/computer monitor."""
+        return self._screen_size
+
+    @screen_size.setter
+    def screen_size(self, value: tuple[float, float]):
+        self._screen_size = (float(value[0]), float(value[1]))
+
+    @property
+    def window_size(self) -> tuple[float, float]:
+        """Size of the UI window."""
+        return self._window_size
+
+    @window_size.setter
+    def window_size(self, value: tuple[float, float]):
+        self._window_size = (float(value[0]), float(value[1]))
+
+    @property
+    def window_position(self) -> tuple[float, float]:
+        """Position of the UI window on the screen."""
+        return self._window_position
+
+    @window_position.setter
+    def window_position(self, value: tuple[float, float]):
+        self._window_position = (float(value[0]), float(value[1]))
+
     def __call__(self, data: dict[str, Any]) -> dict[str, Any]:
         """Compute the screen->window space transformation. Expects a `position` attribute in `data` and will modify this attribute in-place. It will also transform the `velocity` attribute if it is found.
 
@@ -178,17 +350,15 @@ class WindowSpaceFilter:
             return data
 
         position_screen = (x, y)
-        if not (0 <= x <= 1 and 0 <= y <= 1.0):
+        if not (0 <= x <= 1 and 0 <= y <= 1):
             LOGGER.warning(
                 f"Expected eyetracking coordinates in the range [0-1], received: {position_screen}."
             )
-        x *= self.screen_size[0]
-        y *= self.screen_size[1]
-        x -= self.window_position[0]
-        y -= self.window_position[1]
-        in_window = (
-            x > 0 and x < self.window_size[0] and y > 0 and y < self.window_size[1]
-        )
+        (sw, sh), (wx, wy) = self._screen_size, self._window_position
+        x = x * sw - wx
+        y = y * sh - wy
+        ww, wh = self._window_size
+        in_window = 0 < x < ww and 0 < y < wh
         # print((x, y), self.screen_size, self.window_size)
         data["in_window"] = in_window
         data["position"] = (x, y)
@@ -196,11 +366,40 @@ class WindowSpaceFilter:
             data["position_screen"] = position_screen
         if "velocity" in data:
             vx, vy = data["velocity"]
-            data["velocity"] = (vx * self.screen_size[0], vy * self.screen_size[1])
+            data["velocity"] = (vx * sw, vy * sh)
             if self._keep_screen_data:
                 data["velocity_screen"] = (vx, vy)
         return data
 
+    def batch(
+        self, positions: np.ndarray, velocity: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray | None, np.ndarray]:
+        """Compute the screen->window space transformation for a batch of positions (and velocities) in a single vectorised pass, see `__call__` for details. NaN positions remain NaN and are never in the window.
+
+        Args:
+            positions (np.ndarray): array of shape (N, 2) containing eye gaze positions (screen space).
+            velocity (np.ndarray | None, optional): array of shape (N, 2) containing eye gaze velocities (screen space). Defaults to None.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray | None, np.ndarray]: positions (window space), velocities (window space, None if `velocity` is None) and boolean mask of shape (N,) indicating whether each position is in the window.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        screen_size = np.asarray(self._screen_size)
+        window_size = np.asarray(self._window_size)
+        out_of_range = (positions < 0) | (positions > 1)
+        if out_of_range.any():
+            position_screen = tuple(positions[out_of_range.any(axis=1)][0].tolist())
+            LOGGER.warning(
+                f"Expected eyetracking coordinates in the range [0-1], received: {position_screen}."
+            )
+        position = positions * screen_size - np.asarray(self._window_position)
+        in_window = ((position > 0) & (position < window_size)).all(axis=1)
+        if velocity is not None:
+            velocity = (
+                np.asarray(velocity, dtype=np.float64).reshape(-1, 2) * screen_size
+            )
+        return position, velocity, in_window
+
 
 class IVTFilter:
     """Velocity-Threshold Identification Filter (loosely based on http://www.vinis.co.kr/ivt_filter.pdf).
@@ -212,16 +411,33 @@ class IVTFilter:
     IMPORTANT: The `velocity_threshold` is there for sensitive to the coordinate system that is in use, so be aware when using this along side coordinate space transformation filters.
     """
 
-    def __init__(self, velocity_threshold: float):
+    __slots__ = (
+        "data_x",
+        "data_y",
+        "data_t",
+        "velocity_threshold",
+        "min_fixation_duration",
+        "_fixation_start",
+    )
+
+    def __init__(
+        self,
+        velocity_threshold: float,
+        min_fixation_duration: float = 0.0,
+    ):
         """Constructor.
 
         Args:
             velocity_threshold (float): velocity threshold used to determine whether the eye is fixated or saccading.
+            min_fixation_duration (float, optional): fixations that are shorter than this duration are treated as saccades, this only applies to samples that are processed with `IVTFilter.batch`. Defaults to 0.0.
         """
         self.data_x = deque(maxlen=2)
         self.data_y = deque(maxlen=2)
         self.data_t = deque(maxlen=2)
         self.velocity_threshold = velocity_threshold
+        self.min_fixation_duration = min_fixation_duration
+        # start time of the ongoing fixation (NaN if there is none), carried between batches
+        self._fixation_start = math.nan
 
     def __call__(self, data: dict[str, Any]) -> dict[str, Any]:
         """Computes fixation/saccade based on velocity threshold. The velocity is estimated based on the two most recent positions and their associated timestamps. The first event will always be treated as a fixation. The filter assumes that the `position` and `timestamp` attribute are present in `data`.
@@ -260,3 +476,65 @@ class IVTFilter:
             raise ValueError(f"Negative dt: {dt} was found in {IVTFilter.__name__}.")
         data["fixated"] = speed <= self.velocity_threshold
         return data
+
+    def batch(
+        self, positions: np.ndarray, timestamps: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Computes fixation/saccade for a batch of samples in a single vectorised pass. This is equivalent to calling the filter on each sample in order and shares its state with `__call__`, the velocity of the first sample in the batch is estimated using the most recent sample seen by this filter.
+
+        NaN samples are ignored when estimating velocity, their velocity will be NaN and they will not be treated as fixations. If `min_fixation_duration` is set, short fixations are reclassified as saccades (see `ivt_classify`), a fixation that started in a previous batch is measured from its start but only the samples in this batch can be reclassified.
+
+        Args:
+            positions (np.ndarray): array of shape (N, 2) containing eye gaze positions.
+            timestamps (np.ndarray): array of shape (N,) containing the timestamp of each position.
+
+        Raises:
+            ValueError: if the timestamps are not in ascending order.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: velocity array of shape (N, 2) and boolean fixation mask of shape (N,).
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        timestamps = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+        velocity = np.full(positions.shape, np.nan)
+        fixated = np.zeros(positions.shape[0], dtype=bool)
+        valid = ~np.isnan(positions).any(axis=1)
+        pos, ts = positions[valid], timestamps[valid]
+        if pos.shape[0] == 0:
+            return velocity, fixated
+        # the previous sample of each valid sample, the first is taken from the filter state
+        if len(self.data_t) > 0:
+            prev_pos = np.array([[self.data_x[-1], self.data_y[-1]]])
+            prev_ts = np.array([self.data_t[-1]])
+        else:
+            prev_pos, prev_ts = pos[:1], ts[:1]
+        d = np.diff(np.concatenate((prev_pos, pos)), axis=0)
+        dt = np.diff(np.concatenate((prev_ts, ts)))
+        if (dt < 0).any():
+            raise ValueError(
+                f"Negative dt: {dt[dt < 0][0]} was found in {IVTFilter.__name__}."
+            )
+        moving = dt > 0
+        v = np.zeros_like(d)
+        v[moving] = d[moving] / dt[moving, None]
+        velocity[valid] = v
+        if self.min_fixation_duration > 0:
+            speed = np.sqrt(np.einsum("ij,ij->i", v, v))
+            labels, self._fixation_start = ivt_classify(
+                speed,
+                ts,
+                self.velocity_threshold,
+                self.min_fixation_duration,
+                self._fixation_start,
+            )
+            fixated[valid] = labels == FIXATION
+        else:
+            # |d|/dt <= vt is tested as |d|^2 <= (vt * dt)^2 which avoids the sqrt and division
+            sq_distance = np.einsum("ij,ij->i", d, d)
+            sq_threshold = np.square(self.velocity_threshold * dt)
+            fixated[valid] = (sq_distance <= sq_threshold) | ~moving
+        # keep the most recent sample for the next call
+        self.data_x.append(pos[-1, 0])
+        self.data_y.append(pos[-1, 1])
+        self.data_t.append(ts[-1])
+        return velocity, fixated
@@ -1,5 +1,6 @@
 """Module defines the `EyetrackerIOSensor` class which may be attached to an agent to receive `EyeMotionEvent`s as user input, see class documentation for details."""
 
+import numpy as np
 from star_ray.agent import IOSensor, attempt
 from .eyetrackerbase import EyetrackerBase
 from .filter import IVTFilter, WindowSpaceFilter, NWMAFilter, NanValidator
@@ -10,6 +11,9 @@ from ...event import WindowResizeEvent, WindowMoveEvent, ScreenSizeEvent
 class EyetrackerIOSensor(IOSensor):
     """An `IOSensor` implementation that gathers observations `EyeMotionEvent` from an eyetracker."""
 
+    # initial number of samples that can be buffered per cycle, the buffers grow if needed
+    BUFFER_SIZE = 256
+
     def __init__(
         self,
         eyetracker: EyetrackerBase,
@@ -17,6 +21,7 @@ class EyetrackerIOSensor(IOSensor):
         moving_average: int = 10,
         invalid_duration: float = 1,
         should_error: bool = True,
+        min_fixation_duration: float = 0.0,
     ):
         """Constructor.
 
@@ -26,19 +31,28 @@ class EyetrackerIOSensor(IOSensor):
             moving_average (int, optional): moving average window size for the `NWMAFilter`. Defaults to 10.
             invalid_duration (float, optional): how long it is acceptable to have NaN or no eyetracking data before a warning or error is raised.
             should_error (bool, optional): whether to raise an error if the eyetracker is sending nan values, or has not sent a value for the given duration.
+            min_fixation_duration (float, optional): minimum fixation duration for the `IVTFilter`, shorter fixations are treated as saccades. Defaults to 0.0.
         """
         super().__init__(eyetracker)
-        self._ivt_filter = IVTFilter(velocity_threshold)
+        self._ivt_filter = IVTFilter(
+            velocity_threshold, min_fixation_duration=min_fixation_duration
+        )
         nan = tuple([float("nan"), float("nan")])
         self._ws_filter = WindowSpaceFilter(nan, nan, nan)
         self._ma_filter = NWMAFilter(moving_average)
         self._validator = NanValidator(duration=invalid_duration, should_warn=True, should_error=should_error)
+        # preallocated buffers that hold the samples of each batch of raw events, see `_drain`
+        self._positions = np.empty(
+            (EyetrackerIOSensor.BUFFER_SIZE, 2), dtype=np.float64
+        )
+        self._timestamps = np.empty(EyetrackerIOSensor.BUFFER_SIZE, dtype=np.float64)
 
     def __transduce__(self, events: list[EyeMotionEventRaw]) -> list[EyeMotionEvent]:
         """Converts the list of raw eyetracking events to a list of eyetracking events by appling the filters that are part of this sensor.
 
         The filters are applied in order:
-        - `NWMAFilter` - computes a moving average over points
+        - `NanValidator` - checks for long periods of missing or NaN data.
+        - `NWMAFilter` - computes a moving average over points.
         - `IVTFilter` - computes fixation/saccade based on velocity threshold.
         - `WindowSpaceFilter` - computes window UI space coordinates from screen space (requires screen & window information, see methods: `EyetrackerIOSensor.on_window_move`, `EyetrackerIOSensor.on_window_resize`, `EyetrackerIOSensor.on_screen_size`).
 
@@ -51,14 +65,45 @@ class EyetrackerIOSensor(IOSensor):
         return list(self._transduce_iter(events))
 
     def _transduce_iter(self, events: list[EyeMotionEventRaw]):  # noqa
-        # applies all filters to the each eye motion event
-        for event in events:
-            data = event.model_dump()
-            for filter in [self._validator, self._ma_filter, self._ivt_filter, self._ws_filter, ]:
-                data = filter(data)
+        if len(events) == 0:
+            return
+        # the filters are applied to all of the queued events at once
+        positions, timestamps = self._drain(events)
+        self._validator.batch(positions)
+        positions = self._ma_filter.batch(positions)
+        _, fixated = self._ivt_filter.batch(positions, timestamps)
+        position, _, in_window = self._ws_filter.batch(positions)
+        columns = zip(
+            events,
+            position.tolist(),
+            positions.tolist(),
+            fixated.tolist(),
+            in_window.tolist(),
+        )
+        for event, p, ps, f, w in columns:
             # NOTE: position needs to be set properly in the agent (i.e. convert to view space)
-            data["position_raw"] = data["position"]
-            yield EyeMotionEvent.model_validate(data)
+            yield EyeMotionEvent(
+                id=event.id,
+                timestamp=event.timestamp,
+                source=event.source,
+                position=p,
+                position_raw=p,
+                position_screen=ps,
+                fixated=f,
+                in_window=w,
+            )
+
+    def _drain(self, events: list[EyeMotionEventRaw]) -> tuple[np.ndarray, np.ndarray]:
+        # copies the event samples into the preallocated buffers, returns views of the filled part
+        n = len(events)
+        if n > self._timestamps.shape[0]:
+            size = max(n, 2 * self._timestamps.shape[0])
+            self._positions = np.empty((size, 2), dtype=np.float64)
+            self._timestamps = np.empty(size, dtype=np.float64)
+        positions, timestamps = self._positions[:n], self._timestamps[:n]
+        positions[:] = [event.position for event in events]
+        timestamps[:] = [event.timestamp for event in events]
+        return positions, timestamps
 
     @attempt
     def on_window_move(self, event: WindowMoveEvent) -> None:
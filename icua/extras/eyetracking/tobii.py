@@ -67,10 +67,11 @@ class TobiiEyetracker(EyetrackerBase):
             ModuleNotFoundError: If the required `tobii_research` module could not be found.
         """
         # the module was not found, but someone is trying to create an instance of this class!
-        try:
-            import tobii_research as _  # noqa
-        except ModuleNotFoundError as e:
-            raise e
+        # (the import was already attempted once when this module was loaded)
+        if not TOBII_RESEACH_SDK_AVALIABLE:
+            raise ModuleNotFoundError(
+                "Failed to locate module: `tobii_research`, install it with the extra: `tobii`."
+            )
 
         super().__init__()
 
@@ -105,7 +105,6 @@ class LogActuator(Actuator):
         # set the source of these actions to this actuator
         Actuator.set_action_source(self, self._actions)
         for action in self._actions:
-            assert isinstance(action, LogAction)
             self._logger.log(logging.DEBUG, action)
         self._actions.clear()
 
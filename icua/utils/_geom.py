@@ -19,8 +19,8 @@ def bounding_rectangle(rectangles):
         ...     {"x": 100, "y": 100, "width": 200, "height": 200},
         ...     {"x": 150, "y": 150, "width": 50, "height": 50},
         ... ]
-        >>> compute_bounding_rectangle(rectangles)
-        {'x': 0, 'y': 0, 'width': 420, 'height': 420}
+        >>> bounding_rectangle(rectangles)
+        {'x': 0, 'y': 0, 'width': 320, 'height': 320}
     """
     # Initialize min and max values
     min_x = float("inf")
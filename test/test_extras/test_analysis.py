@@ -0,0 +1,42 @@
+"""Test the interval utilities used in analysis."""
+
+import numpy as np
+import pytest
+from icua.extras.analysis import merge_intervals, isin_intervals
+
+_RNG = np.random.default_rng()
+
+
+def merge_intervals_loop(intervals: np.ndarray) -> np.ndarray:  # noqa
+    # reference implementation, merges sorted intervals one at a time
+    intervals = intervals[intervals[:, 0].argsort()]
+    merged = [list(intervals[0])]
+    for start, end in intervals[1:]:
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return np.array(merged)
+
+
+def test_merge_intervals():  # noqa
+    intervals = np.array([[5.0, 6.0], [0.0, 2.0], [1.0, 3.0], [3.0, 4.0], [0.5, 1.0]])
+    assert merge_intervals(intervals).tolist() == [[0.0, 4.0], [5.0, 6.0]]
+    # intervals in `extra` are merged with `intervals`
+    result = merge_intervals(intervals[:2], intervals[2:], np.array([]))
+    assert result.tolist() == [[0.0, 4.0], [5.0, 6.0]]
+
+
+def test_merge_intervals_random():  # noqa
+    for _ in range(100):
+        starts = _RNG.integers(0, 50, size=_RNG.integers(1, 20))
+        intervals = np.stack((starts, starts + _RNG.integers(0, 10, starts.shape)), 1)
+        expected = merge_intervals_loop(intervals)
+        assert np.array_equal(merge_intervals(intervals), expected)
+
+
+def test_merge_intervals_shape():  # noqa
+    with pytest.raises(ValueError):
+        merge_intervals(np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        isin_intervals(np.zeros(2), np.zeros(2))
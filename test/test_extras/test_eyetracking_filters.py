@@ -1,20 +1,30 @@
 """Test eye tracking filters with a stub eytracker."""
 
+import numpy as np
 from icua.extras.eyetracking import (
     EyetrackerIOSensor,
     EyetrackerBase,
     EyeMotionEventRaw,
+    IVTFilter,
+    NWMAFilter,
 )
 from star_ray.event import WindowMoveEvent, WindowResizeEvent, ScreenSizeEvent
 
 from star_ray import Event
 
 
+_RNG = np.random.default_rng()
+
+
 class EyetrackerStub(EyetrackerBase):  # noqa
+    noise_level = 0.01
+
     def get_nowait(self) -> list[Event]:  # noqa
+        # jitter both axes with a single draw
+        x, y = (-0.1, 0.1) + _RNG.uniform(-self.noise_level, self.noise_level, size=2)
         return [
             EyeMotionEventRaw(position=(float("nan"), float("nan"))),
-            EyeMotionEventRaw(position=(-0.1, 0.1)),
+            EyeMotionEventRaw(position=(float(x), float(y))),
         ]
 
     async def get(self):  # noqa
@@ -36,3 +46,43 @@ sensor.on_screen_size(ScreenSizeEvent(size=(100, 100)))
 sensor.__query__(None)
 for obs in sensor.iter_observations():
     print(obs)
+
+
+def test_ivt_batch():  # noqa
+    positions = np.array([[0.1, 0.1], [float("nan")] * 2, [0.2, 0.1], [0.2, 0.12]])
+    timestamps = np.array([0.0, 0.5, 1.0, 2.0])
+    ivt = IVTFilter(0.05)
+    expected = [
+        ivt(dict(position=tuple(p), timestamp=t)) for p, t in zip(positions, timestamps)
+    ]
+    velocity, fixated = IVTFilter(0.05).batch(positions, timestamps)
+    assert fixated.tolist() == [e["fixated"] for e in expected]
+    assert np.allclose(velocity, [e["velocity"] for e in expected], equal_nan=True)
+
+
+def test_nwma_batch():  # noqa
+    positions = _RNG.uniform(size=(12, 2))
+    positions[4] = float("nan")
+    nwma = NWMAFilter(3)
+    expected = [nwma(dict(position=tuple(p)))["position"] for p in positions]
+    nwma = NWMAFilter(3)
+    # split across batches, the ring buffer must carry over between them
+    result = np.concatenate((nwma.batch(positions[:5]), nwma.batch(positions[5:])))
+    assert np.allclose(result, expected, equal_nan=True)
+
+
+def test_ivt_batch_min_fixation_duration():  # noqa
+    # a long fixation, a fixation that is too short, then a long fixation (sampled at 20Hz)
+    runs = [((0.1, 0.1), 11), ((0.5, 0.5), 3), ((0.9, 0.9), 10), ((0.1, 0.9), 1)]
+    positions = np.array([p for p, n in runs for _ in range(n)])
+    timestamps = np.arange(positions.shape[0]) * 0.05
+    _, fixated = IVTFilter(0.05, min_fixation_duration=0.2).batch(positions, timestamps)
+    expected = [True] * 11 + [False] * 3 + [False] + [True] * 9 + [False]
+    assert fixated.tolist() == expected
+    # fixations that span several batches are measured from their start (the short
+    # fixation is not split, samples from a previous batch cannot be reclassified)
+    for splits in ([12], [15, 22], [5, 20, 23], [2, 4, 6, 8, 10, 12, 16, 18, 20, 24]):
+        ivt = IVTFilter(0.05, min_fixation_duration=0.2)
+        batches = zip(np.split(positions, splits), np.split(timestamps, splits))
+        result = np.concatenate([ivt.batch(p, t)[1] for p, t in batches])
+        assert result.tolist() == expected, splits
@@ -0,0 +1,94 @@
+"""Test the task acceptability sensor without an agent or environment."""
+
+import pytest
+from star_ray.event import Observation, ErrorObservation
+from star_ray_xml import Select
+from icua.agent import TaskAcceptabilitySensor
+
+
+class TaskSensor(TaskAcceptabilitySensor):  # noqa
+    def __init__(self, **kwargs):  # noqa
+        super().__init__("task", **kwargs)
+        self.evaluations = 0
+
+    def is_active(self, task: str = None, **kwargs) -> bool:  # noqa
+        self.evaluations += 1
+        return self.beliefs["task"]["active"] == "true"
+
+    def is_acceptable(self, task: str = None, **kwargs) -> bool:  # noqa
+        return self.beliefs["task"]["fill"] == "green"
+
+    def sense(self) -> list[Select]:  # noqa
+        return [self.sense_element("task", attributes=("active", "fill"))]
+
+
+def observe(sensor: TaskSensor, active: str, fill: str):  # noqa
+    observation = Observation(values=[dict(id="task", active=active, fill=fill)])
+    sensor.__transduce__([observation])
+    return [o.values for o in sensor.iter_observations()]
+
+
+def test_evaluate_every_cycle():  # noqa
+    sensor = TaskSensor()
+    observe(sensor, "true", "red")
+    observe(sensor, "true", "red")
+    assert sensor.evaluations == 2
+
+
+def test_evaluate_on_change():  # noqa
+    sensor = TaskSensor(evaluate_on_change=True)
+    observe(sensor, "true", "red")
+    observe(sensor, "true", "red")
+    assert sensor.evaluations == 1
+    observe(sensor, "true", "green")
+    assert sensor.evaluations == 2
+    # acceptability that depends on something other than beliefs must be invalidated
+    sensor.invalidate_acceptability()
+    list(sensor.iter_observations())
+    assert sensor.evaluations == 3
+
+
+def test_report_every_cycle():  # noqa
+    sensor = TaskSensor()
+    assert len(observe(sensor, "true", "red")) == 1
+    assert len(observe(sensor, "true", "red")) == 1
+
+
+def test_report_on_change():  # noqa
+    sensor = TaskSensor(report_on_change=True)
+    assert observe(sensor, "true", "red") == [
+        dict(task="task", is_active=True, is_acceptable=False)
+    ]
+    assert observe(sensor, "true", "red") == []
+    assert observe(sensor, "true", "green") == [
+        dict(task="task", is_active=True, is_acceptable=True)
+    ]
+    # the acceptability of an inactive task is always False
+    assert observe(sensor, "false", "green") == [
+        dict(task="task", is_active=False, is_acceptable=False)
+    ]
+    # reported again when the sensor is added to an agent
+    sensor.on_add(None)
+    assert len(observe(sensor, "false", "green")) == 1
+
+
+def test_observation_dispatch():  # noqa
+    class TaskObservation(Observation):  # noqa
+        pass
+
+    sensor = TaskSensor()
+    error = ErrorObservation.from_exception(ValueError("missing element"))
+    # the handler of each observation type is resolved once and reused
+    for _ in range(2):
+        sensor.__transduce__(
+            [
+                error,
+                TaskObservation(values=[dict(id="task", active="true", fill="green")]),
+            ]
+        )
+    assert sensor.beliefs == dict(task=dict(active="true", fill="green"))
+    observations = list(sensor.iter_observations())
+    assert observations[:2] == [error, error]
+    assert observations[2].values["is_acceptable"]
+    with pytest.raises(TypeError):
+        sensor.__transduce__([dict(id="task")])
@@ -0,0 +1,132 @@
+"""Test the guidance actions against the state of an `XMLAmbient` (without an environment)."""
+
+import pytest
+from star_ray_xml import (
+    XMLAmbient,
+    XMLState,
+    XPathElementsNotFound,
+    select,
+    update,
+    delete,
+)
+from star_ray_pygame import SVGAmbient
+from icua.event import (
+    DrawArrowAction,
+    DrawBoxAction,
+    DrawBoxOnElementAction,
+    ShowElementAction,
+    HideElementAction,
+)
+
+SVG = """<svg:svg xmlns:svg="http://www.w3.org/2000/svg" id="root" width="200" height="200"><svg:svg id="task" x="100" y="50" width="40" height="20"/></svg:svg>"""
+
+
+def new_state() -> XMLState:  # noqa
+    ambient = XMLAmbient([], xml=SVG, namespaces=SVGAmbient.DEFAULT_SVG_NAMESPACES)
+    return ambient.get_state()
+
+
+def select_attrs(state: XMLState, xpath: str, attrs: list[str]):  # noqa
+    try:
+        return state.select(select(xpath, attrs=attrs))
+    except XPathElementsNotFound:
+        return []
+
+
+def test_draw_box_on_element():  # noqa
+    # each state has its own elements, boxes drawn in one state are never updated in another
+    action = DrawBoxOnElementAction(xpath="//*[@id='task']", box_data=dict(id="box"))
+    states = [new_state() for _ in range(3)]
+    for state in states:
+        action.__execute__(state)
+        action.__execute__(state)
+    for state in states:
+        # the box is drawn (once) in the task's parent
+        result = select_attrs(
+            state, "/svg:svg/svg:rect", ["id", "x", "y", "width", "height"]
+        )
+        assert result == [dict(id="box", x=100, y=50, width=40, height=20)]
+
+
+def test_draw_box_after_remove():  # noqa
+    state = new_state()
+    action = DrawBoxAction(
+        xpath="/svg:svg", box_data=dict(id="box", x=1, y=2, width=3, height=4)
+    )
+    action.__execute__(state)
+    # a box that was removed from the tree is drawn again rather than updated
+    state.delete(delete("//*[@id='box']"))
+    action.__execute__(state)
+    assert len(select_attrs(state, "//*[@id='box']", ["id"])) == 1
+
+
+def test_draw_quoted_id():  # noqa
+    # ids are quoted in the xpaths that are used to find existing elements
+    for box_id in ("a'box", 'a"box', "a'b\"ox"):
+        state = new_state()
+        data = dict(id=box_id, x=1, y=2, width=3, height=4)
+        DrawBoxAction(xpath="/svg:svg", box_data=data).__execute__(state)
+        DrawBoxAction(xpath="/svg:svg", box_data=data).__execute__(state)
+        assert select_attrs(state, "/svg:svg/svg:rect", ["id"]) == [dict(id=box_id)]
+
+
+def test_draw_arrow_scale():  # noqa
+    state = new_state()
+    DrawArrowAction(xpath="/svg:svg", data=dict(id="arrow", scale=2)).__execute__(state)
+    xpath = "//*[@id='arrow']"
+    assert select_attrs(state, xpath, ["transform"]) == [dict(transform="scale(2)")]
+    # updating the scale sets a `scale(...)` transform (this used to set "transform")
+    DrawArrowAction(xpath="/svg:svg", data=dict(id="arrow", scale=0.5)).__execute__(
+        state
+    )
+    assert select_attrs(state, xpath, ["transform"]) == [dict(transform="scale(0.5)")]
+    # x and y are the center of the scaled arrow
+    DrawArrowAction(xpath="/svg:svg", data=dict(id="arrow", x=100, y=100)).__execute__(
+        state
+    )
+    assert select_attrs(state, xpath, ["x", "y"]) == [dict(x=50.0, y=50.0)]
+
+
+def test_draw_box_on_missing_element():  # noqa
+    action = DrawBoxOnElementAction(xpath="//*[@id='missing']", box_data=dict(id="box"))
+    with pytest.raises(XPathElementsNotFound):
+        action.__execute__(new_state())
+
+
+@pytest.mark.parametrize("xpath", ["//*[@id='task']", "/svg:svg/svg:svg", "//*"])
+def test_show_hide_element(xpath: str):  # noqa
+    # the actions are equivalent to an `update` query at the same xpath
+    for action, opacity in ((HideElementAction, "0"), (ShowElementAction, "1")):
+        state, expected = new_state(), new_state()
+        action(xpath=xpath).__execute__(state)
+        expected.update(update(xpath, attrs=dict(opacity=opacity)))
+        result = select_attrs(state, "//*", ["id", "opacity"])
+        assert result == select_attrs(expected, "//*", ["id", "opacity"])
+    with pytest.raises(XPathElementsNotFound):
+        HideElementAction(xpath="//*[@id='missing']").__execute__(new_state())
+
+
+def test_show_hide_redrawn_element():  # noqa
+    state = new_state()
+    draw = DrawArrowAction(xpath="/svg:svg", data=dict(id="arrow"))
+    draw.__execute__(state)
+    xpath = "//*[@id='arrow']"
+    HideElementAction(xpath=xpath).__execute__(state)
+    # an element that is removed and drawn again is shown/hidden rather than the old one
+    state.delete(delete(xpath))
+    draw.__execute__(state)
+    assert select_attrs(state, xpath, ["opacity"]) == [dict(opacity=1)]
+    HideElementAction(xpath=xpath).__execute__(state)
+    assert select_attrs(state, xpath, ["opacity"]) == [dict(opacity=0)]
+
+
+def test_draw_arrow_point_to():  # noqa
+    state = new_state()
+    data = dict(id="arrow", x=100, y=100, rotation=10, point_to="task")
+    DrawArrowAction(xpath="/svg:svg", data=data).__execute__(state)
+    DrawArrowAction(xpath="/svg:svg", data=data).__execute__(state)
+    # pointing to the task takes precedence over `rotation`
+    rotation = DrawArrowAction.rotation_from_point_to(state, "task", "//*[@id='arrow']")
+    result = select_attrs(state, "//*[@id='arrow']/svg:polygon", ["transform"])
+    assert result == [dict(transform=DrawArrowAction.new_rotation(rotation))]
+    assert DrawArrowAction.get_element_center(state, "//*[@id='task']") == (120, 60)
@@ -0,0 +1,30 @@
+"""Test the user input history of the guidance agent."""
+
+import pytest
+from icua.agent import GuidanceAgent, BoxGuidanceActuator
+
+
+def get_history_sizes(agent: GuidanceAgent) -> list[int]:  # noqa
+    # fill the history of each user input type and count how many events are kept
+    sizes = []
+    for t in agent.user_input_types:
+        events = [t.model_construct() for _ in range(20)]
+        for event in events:
+            agent.on_user_input(event)
+        latest = list(agent.get_latest_user_input(t, n=len(events)))
+        assert latest == events[::-1][: len(latest)]  # latest event first
+        sizes.append(len(latest))
+    return sizes
+
+
+def test_user_input_events_history_size():  # noqa
+    agent = GuidanceAgent([], [BoxGuidanceActuator()], user_input_events_history_size=3)
+    assert set(get_history_sizes(agent)) == {3}
+    sizes = list(range(1, len(agent.user_input_types) + 1))
+    agent = GuidanceAgent(
+        [], [BoxGuidanceActuator()], user_input_events_history_size=sizes
+    )
+    assert get_history_sizes(agent) == sizes
+    # a size is required for each user input type
+    with pytest.raises(ValueError):
+        GuidanceAgent([], [BoxGuidanceActuator()], user_input_events_history_size=[1])